@@ -1,6 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
-from typing import List, Optional
+from typing import AsyncIterator, List, Literal, Optional
+import csv
+import gzip
+import io
+import json
+import tempfile
 import uuid
 
 from app.models.university import (
@@ -11,59 +19,425 @@ from app.models.university import (
     UniversityListResponse,
     UniversityType,
     Ranking,
-    AcademicProgramResponse
+    AcademicProgramResponse,
+    UniversityImportReport,
+    UniversityBulkUpdate,
+    UniversityBulkUpdateResult,
+    UniversityBulkStatus,
+    UniversityFacets,
+    UniversityFacetedResponse,
+    ProgramSearchResult,
+    Language,
+    UniversitySort
 )
 from app.models.user import User
-from app.services.university_service import UniversityService, AcademicProgramService
+from app.services.university_service import (
+    UniversityService,
+    AcademicProgramService,
+    UNIVERSITY_LIST_TAG,
+    university_tag
+)
+from app.services.university_import import UniversityImportService, read_csv, read_jsonl
 from app.auth.dependencies import get_admin_user, get_current_user_optional
-from app.core.database import get_session
+from app.core.config import settings as Config
+from app.core.database import get_session, get_read_session, get_session_maker
+from app.core.cache import response_cache, json_response
+from app.core.serialization import Serializer
+from app.core.http_cache import (
+    cache_control,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    validator_headers
+)
 
 router = APIRouter(prefix="/universities", tags=["Universities"])
 
 # Create service instances (no session in constructor anymore)
 university_service = UniversityService()
 program_service = AcademicProgramService()
+import_service = UniversityImportService()
+
+university_serializer = Serializer(UniversityResponse)
+university_list_serializer = Serializer(List[UniversityListResponse])
+program_list_serializer = Serializer(List[AcademicProgramResponse])
+program_search_serializer = Serializer(List[ProgramSearchResult])
+
+# Rows per chunk written to an export stream
+EXPORT_CHUNK_ROWS = 500
+
+# Uploads larger than this are spooled to disk while they are imported
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+# Responses differ by Accept-Encoding once served from the compressed cache
+CACHED_RESPONSE_HEADERS = {"Vary": "Accept-Encoding"}
+
+
+async def university_validators(cache_key: str, university_id: uuid.UUID, session: AsyncSession) -> dict:
+    """ETag and Last-Modified for a single university's responses, empty if it does not exist"""
+    version = await university_service.get_university_version(university_id, session)
+    if version is None:
+        return {}
+
+    updated_at, program_count, programs_updated_at = version
+    last_modified = max(filter(None, (updated_at, programs_updated_at)), default=None)
+    return {
+        **validator_headers(make_etag(cache_key, updated_at, program_count, programs_updated_at), last_modified),
+        **CACHED_RESPONSE_HEADERS
+    }
 
 
 @router.get("/", response_model=List[UniversityListResponse])
 async def get_universities(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip (offset mode)"),
     limit: int = Query(100, ge=1, le=100, description="Number of records to return"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset pagination cursor. Pass an empty value for the first page, "
+                    "then the X-Next-Cursor header of each response"
+    ),
     country: Optional[str] = Query(None, description="Filter by country"),
     city: Optional[str] = Query(None, description="Filter by city"),
     university_type: Optional[UniversityType] = Query(None, description="Filter by university type"),
     ranking: Optional[Ranking] = Query(None, description="Filter by ranking"),
     offers_scholarships: Optional[bool] = Query(None, description="Filter by scholarship availability"),
     provides_accommodation: Optional[bool] = Query(None, description="Filter by accommodation availability"),
-    search: Optional[str] = Query(None, description="Search by university name"),
-    session: AsyncSession = Depends(get_session),
+    search: Optional[str] = Query(None, description="Search name, city, country and description; results are ranked by relevance and tolerate typos"),
+    min_tuition: Optional[float] = Query(None, ge=0, description="Minimum average annual tuition in USD"),
+    max_tuition: Optional[float] = Query(None, ge=0, description="Maximum average annual tuition in USD"),
+    min_acceptance_rate: Optional[float] = Query(None, ge=0, le=100, description="Minimum acceptance rate (percentage)"),
+    max_acceptance_rate: Optional[float] = Query(None, ge=0, le=100, description="Maximum acceptance rate (percentage)"),
+    min_founded_year: Optional[int] = Query(None, description="Founded in or after this year"),
+    max_founded_year: Optional[int] = Query(None, description="Founded in or before this year"),
+    min_nigerian_students: Optional[int] = Query(None, ge=0, description="Minimum number of Nigerian students"),
+    max_nigerian_students: Optional[int] = Query(None, ge=0, description="Maximum number of Nigerian students"),
+    sort: Optional[UniversitySort] = Query(
+        None,
+        description="Sort order, '-' for descending; defaults to name, or relevance when searching. "
+                    "Universities without a value for a numeric sort come last"
+    ),
+    count: Optional[Literal["exact", "estimated", "capped"]] = Query(
+        None,
+        description="Return the number of matches in X-Total-Count: exact, estimated "
+                    "(fast, approximate) or capped (exact up to a limit, then e.g. '1000+')"
+    ),
+    session: AsyncSession = Depends(get_read_session),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
     Get list of universities with filtering options.
     
+    Cursor mode (`?cursor=`) is the recommended way to page through results:
+    universities are ordered by `sort` (name by default) and each page costs the
+    same however deep it is. The cursor for the next page is returned in the `X-Next-Cursor`
+    header, which is absent on the last page. Offset mode (`skip`) is kept for
+    compatibility but gets slower the further you page.
+    
+    Pass `count` to get the number of matches in the `X-Total-Count` header.
+    Prefer `estimated` or `capped` on broad queries; `exact` counts every match.
+    
     This endpoint is accessible to both authenticated and unauthenticated users.
     """
-    universities = await university_service.get_universities(
-        session=session,
-        skip=skip,
-        limit=limit,
+    filters = dict(
+        country=country,
+        city=city,
+        university_type=university_type,
+        ranking=ranking,
+        offers_scholarships=offers_scholarships,
+        provides_accommodation=provides_accommodation,
+        search=search,
+        min_tuition=min_tuition,
+        max_tuition=max_tuition,
+        min_acceptance_rate=min_acceptance_rate,
+        max_acceptance_rate=max_acceptance_rate,
+        min_founded_year=min_founded_year,
+        max_founded_year=max_founded_year,
+        min_nigerian_students=min_nigerian_students,
+        max_nigerian_students=max_nigerian_students
+    )
+
+    cache_key = response_cache.key(
+        "universities:list",
+        dict(filters, skip=skip, limit=limit, cursor=cursor, sort=sort, count=count)
+    )
+    policy = cache_control("universities.list")
+    cached = await response_cache.get(cache_key)
+    if cached:
+        if is_not_modified(request, cached.headers):
+            return not_modified_response({**cached.headers, **policy}, request)
+        return response_cache.render(cached, request, policy)
+
+    # Answer revalidations from the cheap version probe, before the list query
+    last_modified = await university_service.get_catalogue_version(session)
+    headers = validator_headers(make_etag(cache_key, last_modified), last_modified)
+    if is_not_modified(request, headers):
+        return not_modified_response({**headers, **CACHED_RESPONSE_HEADERS, **policy}, request)
+
+    headers.update(CACHED_RESPONSE_HEADERS)
+    if count is not None:
+        headers["X-Total-Count"] = await university_service.count_universities(
+            session,
+            mode=count,
+            cap=Config.LIST_COUNT_CAP,
+            **filters
+        )
+
+    if cursor is not None:
+        universities, next_cursor = await university_service.get_universities_page(
+            session=session,
+            cursor=cursor,
+            limit=limit,
+            sort=sort,
+            **filters
+        )
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+    else:
+        universities = await university_service.get_university_summaries(
+            session=session,
+            skip=skip,
+            limit=limit,
+            sort=sort,
+            **filters
+        )
+    
+    body = university_list_serializer.dump(universities)
+    await response_cache.set(cache_key, body, tags=[UNIVERSITY_LIST_TAG], headers=headers)
+    return json_response(body, {**headers, **policy})
+
+
+@router.get("/facets", response_model=UniversityFacetedResponse)
+async def get_universities_with_facets(
+    skip: int = Query(0, ge=0, description="Number of records to skip (offset mode)"),
+    limit: int = Query(20, ge=1, le=100, description="Number of records to return"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset pagination cursor, as for the list endpoint"
+    ),
+    country: Optional[str] = Query(None, description="Filter by country"),
+    city: Optional[str] = Query(None, description="Filter by city"),
+    university_type: Optional[UniversityType] = Query(None, description="Filter by university type"),
+    ranking: Optional[Ranking] = Query(None, description="Filter by ranking"),
+    offers_scholarships: Optional[bool] = Query(None, description="Filter by scholarship availability"),
+    provides_accommodation: Optional[bool] = Query(None, description="Filter by accommodation availability"),
+    search: Optional[str] = Query(None, description="Search name, city, country and description"),
+    min_tuition: Optional[float] = Query(None, ge=0, description="Minimum average annual tuition in USD"),
+    max_tuition: Optional[float] = Query(None, ge=0, description="Maximum average annual tuition in USD"),
+    min_acceptance_rate: Optional[float] = Query(None, ge=0, le=100, description="Minimum acceptance rate (percentage)"),
+    max_acceptance_rate: Optional[float] = Query(None, ge=0, le=100, description="Maximum acceptance rate (percentage)"),
+    min_founded_year: Optional[int] = Query(None, description="Founded in or after this year"),
+    max_founded_year: Optional[int] = Query(None, description="Founded in or before this year"),
+    min_nigerian_students: Optional[int] = Query(None, ge=0, description="Minimum number of Nigerian students"),
+    max_nigerian_students: Optional[int] = Query(None, ge=0, description="Maximum number of Nigerian students"),
+    sort: Optional[UniversitySort] = Query(None, description="Sort order of the results, as for the list endpoint"),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Get a page of universities together with facet counts for the filter sidebar.
+    
+    Takes the same filters as the list endpoint. `facets` holds, for every
+    country, type, ranking, scholarship and accommodation option, how many
+    universities match it under the other active filters, plus the total
+    number of matches. Facet counts are cached per filter combination,
+    independently of the page requested.
+    
+    This endpoint is accessible to both authenticated and unauthenticated users.
+    """
+    filters = dict(
         country=country,
         city=city,
         university_type=university_type,
         ranking=ranking,
         offers_scholarships=offers_scholarships,
         provides_accommodation=provides_accommodation,
-        search=search
+        search=search,
+        min_tuition=min_tuition,
+        max_tuition=max_tuition,
+        min_acceptance_rate=min_acceptance_rate,
+        max_acceptance_rate=max_acceptance_rate,
+        min_founded_year=min_founded_year,
+        max_founded_year=max_founded_year,
+        min_nigerian_students=min_nigerian_students,
+        max_nigerian_students=max_nigerian_students
     )
+
+    facets_key = response_cache.key("universities:facets", filters)
+    cached = await response_cache.get(facets_key)
+    if cached:
+        facets = UniversityFacets.model_validate_json(gzip.decompress(cached.body))
+    else:
+        facets = await university_service.get_university_facets(session, **filters)
+        await response_cache.set(facets_key, facets.model_dump_json().encode(), tags=[UNIVERSITY_LIST_TAG])
+
+    headers = dict(cache_control("universities.list"))
+    if cursor is not None:
+        universities, next_cursor = await university_service.get_universities_page(
+            session=session,
+            cursor=cursor,
+            limit=limit,
+            sort=sort,
+            **filters
+        )
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+    else:
+        universities = await university_service.get_university_summaries(
+            session=session,
+            skip=skip,
+            limit=limit,
+            sort=sort,
+            **filters
+        )
+
+    body = UniversityFacetedResponse(
+        results=university_list_serializer.validate(universities),
+        facets=facets
+    ).model_dump_json().encode()
+    return json_response(body, headers)
+
+
+@router.get("/programs/search", response_model=List[ProgramSearchResult])
+async def search_programs(
+    request: Request,
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset pagination cursor from the X-Next-Cursor header of the previous page"
+    ),
+    limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
+    name: Optional[str] = Query(None, description="Match part of the program name"),
+    degree_type: Optional[str] = Query(None, description="Exact degree type, e.g. Master's"),
+    faculty: Optional[str] = Query(None, description="Exact faculty"),
+    department: Optional[str] = Query(None, description="Exact department"),
+    min_tuition: Optional[float] = Query(None, ge=0, description="Minimum annual tuition fee in USD"),
+    max_tuition: Optional[float] = Query(None, ge=0, description="Maximum annual tuition fee in USD"),
+    min_duration: Optional[float] = Query(None, ge=0, description="Minimum duration in years"),
+    max_duration: Optional[float] = Query(None, ge=0, description="Maximum duration in years"),
+    country: Optional[str] = Query(None, description="Filter by the university's country"),
+    language: Optional[Language] = Query(None, description="Filter by a language of instruction of the university"),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Search academic programs across all active universities.
+    
+    Results are ordered by program name and paged with a cursor: the cursor
+    for the next page is returned in the `X-Next-Cursor` header, which is
+    absent on the last page.
     
-    return [UniversityListResponse.model_validate(uni) for uni in universities]
+    This endpoint is accessible to both authenticated and unauthenticated users.
+    """
+    filters = dict(
+        name=name,
+        degree_type=degree_type,
+        faculty=faculty,
+        department=department,
+        min_tuition=min_tuition,
+        max_tuition=max_tuition,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        country=country,
+        language=language
+    )
+
+    cache_key = response_cache.key("programs:search", dict(filters, cursor=cursor, limit=limit))
+    policy = cache_control("universities.programs")
+    cached = await response_cache.get(cache_key)
+    if cached:
+        return response_cache.render(cached, request, policy)
+
+    programs, next_cursor = await program_service.search_programs(
+        session=session,
+        cursor=cursor,
+        limit=limit,
+        **filters
+    )
+
+    headers = dict(CACHED_RESPONSE_HEADERS)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+
+    body = program_search_serializer.dump(programs)
+    # Programs only change through their university, and every such write
+    # invalidates the list tag
+    await response_cache.set(cache_key, body, tags=[UNIVERSITY_LIST_TAG], headers=headers)
+    return json_response(body, {**headers, **policy})
+
+
+@router.get("/export")
+async def export_universities(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+    include_programs: bool = Query(False, description="Inline each university's academic programs"),
+    include_inactive: bool = Query(False, description="Include deactivated universities and programs"),
+    session_maker: async_sessionmaker = Depends(get_session_maker),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Export the whole catalogue as NDJSON (one university per line) or CSV.
+    
+    The export is streamed from a server-side cursor, so it is a single request
+    with constant memory use however large the catalogue is. In CSV, programs
+    and languages are JSON-encoded cells.
+    
+    Only admin users can export the catalogue.
+    """
+    async def ndjson_chunks() -> AsyncIterator[bytes]:
+        async with session_maker() as session:
+            chunk = []
+            async for university in university_service.stream_universities(
+                session, include_programs=include_programs, include_inactive=include_inactive
+            ):
+                chunk.append(to_json(university))
+                if len(chunk) >= EXPORT_CHUNK_ROWS:
+                    yield b"\n".join(chunk) + b"\n"
+                    chunk = []
+            if chunk:
+                yield b"\n".join(chunk) + b"\n"
+
+    async def csv_chunks() -> AsyncIterator[bytes]:
+        columns = [column.name for column in University.__table__.columns]
+        if include_programs:
+            columns.append("academic_programs")
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns)
+        writer.writeheader()
+
+        async with session_maker() as session:
+            rows = 0
+            async for university in university_service.stream_universities(
+                session, include_programs=include_programs, include_inactive=include_inactive
+            ):
+                university["languages_of_instruction"] = to_json(university["languages_of_instruction"]).decode()
+                if include_programs:
+                    university["academic_programs"] = to_json(university["academic_programs"]).decode()
+                writer.writerow(university)
+                rows += 1
+                if rows % EXPORT_CHUNK_ROWS == 0:
+                    yield buffer.getvalue().encode()
+                    buffer.seek(0)
+                    buffer.truncate()
+        yield buffer.getvalue().encode()
+
+    if format == "csv":
+        return StreamingResponse(
+            csv_chunks(),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="universities.csv"'}
+        )
+    return StreamingResponse(
+        ndjson_chunks(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="universities.ndjson"'}
+    )
 
 
 @router.get("/{university_id}", response_model=UniversityResponse)
 async def get_university(
     university_id: uuid.UUID,
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -71,8 +445,22 @@ async def get_university(
     
     This endpoint is accessible to both authenticated and unauthenticated users.
     """
+    cache_key = response_cache.key("universities:detail", {"uid": university_id})
+    policy = cache_control("universities.detail")
+    cached = await response_cache.get(cache_key)
+    if cached:
+        if is_not_modified(request, cached.headers):
+            return not_modified_response({**cached.headers, **policy}, request)
+        return response_cache.render(cached, request, policy)
+
+    headers = await university_validators(cache_key, university_id, session)
+    if headers and is_not_modified(request, headers):
+        return not_modified_response({**headers, **policy}, request)
+
     university = await university_service.get_university_by_id(university_id, session)
-    return UniversityResponse.model_validate(university)
+    body = university_serializer.dump(university)
+    await response_cache.set(cache_key, body, tags=[university_tag(university_id)], headers=headers)
+    return json_response(body, {**headers, **policy})
 
 
 @router.post("/", response_model=UniversityResponse, status_code=status.HTTP_201_CREATED)
@@ -87,8 +475,89 @@ async def create_university(
     Only admin users can create universities.
     """
     university = await university_service.create_university(university_data, session)
-    university_dict = {k: v for k, v in university.__dict__.items() if not k.startswith("_")}
-    return UniversityResponse.model_validate(university_dict)
+    return json_response(university_serializer.dump(university), status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/import", response_model=UniversityImportReport)
+async def import_universities(
+    request: Request,
+    format: Literal["jsonl", "csv"] = Query("jsonl", description="Format of the request body"),
+    batch_size: int = Query(500, ge=1, le=5000, description="Rows validated and written per transaction"),
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Bulk-import universities with nested academic programs.
+    
+    The request body is JSONL (one UniversityCreate object per line) or CSV with
+    a header row of UniversityCreate fields, where `languages_of_instruction`
+    and `academic_programs` are JSON cells, as produced by the export endpoint.
+    Rows are written in batches with multi-row inserts. Invalid rows are
+    skipped and listed in the report instead of failing the whole load.
+    
+    Only admin users can import universities.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as upload:
+        async for chunk in request.stream():
+            upload.write(chunk)
+        upload.seek(0)
+
+        text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+        records = read_csv(text) if format == "csv" else read_jsonl(text)
+        return await import_service.import_universities(records, session, batch_size=batch_size)
+
+
+@router.patch("/", response_model=UniversityBulkUpdateResult)
+async def bulk_update_universities(
+    bulk_data: UniversityBulkUpdate,
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Update many universities at once, in a single transaction.
+    
+    Send either `updates`, a list of `{"uid": ..., "fields": {...}}` objects,
+    or a `filter` (same criteria as the list endpoint; active universities
+    only) together with the `fields` to set on every match. Only the fields
+    present are changed. Uids that do not exist are returned in `not_found`.
+    
+    Only admin users can update universities.
+    """
+    return await university_service.bulk_update_universities(bulk_data, session)
+
+
+@router.post("/deactivate", response_model=UniversityBulkUpdateResult)
+async def deactivate_universities(
+    bulk_data: UniversityBulkStatus,
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Deactivate many universities and their programs at once (soft delete).
+    
+    Send either `uids` or a `filter` with the same criteria as the list
+    endpoint, which matches active universities.
+    
+    Only admin users can deactivate universities.
+    """
+    return await university_service.set_universities_active(bulk_data, False, session)
+
+
+@router.post("/reactivate", response_model=UniversityBulkUpdateResult)
+async def reactivate_universities(
+    bulk_data: UniversityBulkStatus,
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Reactivate many universities and their programs at once.
+    
+    Send either `uids` or a `filter` with the same criteria as the list
+    endpoint, which matches inactive universities.
+    
+    Only admin users can reactivate universities.
+    """
+    return await university_service.set_universities_active(bulk_data, True, session)
 
 
 @router.put("/{university_id}", response_model=UniversityResponse)
@@ -104,7 +573,7 @@ async def update_university(
     Only admin users can update universities.
     """
     university = await university_service.update_university(university_id, university_data, session)
-    return UniversityResponse.model_validate(university)
+    return json_response(university_serializer.dump(university))
 
 
 @router.delete("/{university_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -125,7 +594,8 @@ async def delete_university(
 @router.get("/{university_id}/programs", response_model=List[AcademicProgramResponse])
 async def get_university_programs(
     university_id: uuid.UUID,
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -133,18 +603,34 @@ async def get_university_programs(
     
     This endpoint is accessible to both authenticated and unauthenticated users.
     """
-    # First check if university exists
-    await university_service.get_university_by_id(university_id, session)
-    
-    # Get programs
+    cache_key = response_cache.key("universities:programs", {"uid": university_id})
+    policy = cache_control("universities.programs")
+    cached = await response_cache.get(cache_key)
+    if cached:
+        if is_not_modified(request, cached.headers):
+            return not_modified_response({**cached.headers, **policy}, request)
+        return response_cache.render(cached, request, policy)
+
+    # The version probe doubles as the existence check
+    headers = await university_validators(cache_key, university_id, session)
+    if not headers:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="University not found"
+        )
+    if is_not_modified(request, headers):
+        return not_modified_response({**headers, **policy}, request)
+
     programs = await program_service.get_programs_by_university(university_id, session)
     
-    return [AcademicProgramResponse.model_validate(program) for program in programs]
+    body = program_list_serializer.dump(programs)
+    await response_cache.set(cache_key, body, tags=[university_tag(university_id)], headers=headers)
+    return json_response(body, {**headers, **policy})
 
 
 @router.get("/statistics/summary")
 async def get_university_statistics(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     admin_user: User = Depends(get_admin_user)
 ):
     """
@@ -158,20 +644,28 @@ async def get_university_statistics(
 
 # Additional utility endpoints (these don't need async since they don't use database)
 
+def enum_response(request: Request, content: dict) -> Response:
+    """Long-lived, revalidatable response for the static enum endpoints"""
+    body = json.dumps(content).encode()
+    headers = {**validator_headers(make_etag(body)), **cache_control("universities.enums")}
+    if is_not_modified(request, headers):
+        return not_modified_response(headers, request)
+    return json_response(body, headers)
+
+
 @router.get("/enums/types")
-async def get_university_types():
+async def get_university_types(request: Request):
     """Get available university types"""
-    return {"university_types": [t.value for t in UniversityType]}
+    return enum_response(request, {"university_types": [t.value for t in UniversityType]})
 
 
 @router.get("/enums/rankings")
-async def get_rankings():
+async def get_rankings(request: Request):
     """Get available ranking options"""
-    return {"rankings": [r.value for r in Ranking]}
+    return enum_response(request, {"rankings": [r.value for r in Ranking]})
 
 
 @router.get("/enums/languages")
-async def get_languages():
+async def get_languages(request: Request):
     """Get available languages of instruction"""
-    from app.models.university import Language
-    return {"languages": [l.value for l in Language]}
+    return enum_response(request, {"languages": [l.value for l in Language]})
@@ -1,10 +1,11 @@
 from fastapi import Request, status, Depends
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
-from app.auth.utils import decode_token
+from app.auth.utils import decode_token_cached
 from fastapi.exceptions import HTTPException
 from app.core.redis import token_in_blocklist
 from app.core.database import get_session
+from app.core.timing import timed
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from .services import UserService
@@ -22,15 +23,19 @@ class TokenBearer(HTTPBearer):
         super().__init__(auto_error=auto_error)
 
     async def __call__(self, request: Request) -> HTTPAuthorizationCredentials | None:
+        with timed("auth"):
+            return await self.authenticate(request)
+
+    async def authenticate(self, request: Request) -> HTTPAuthorizationCredentials | None:
         creds = await super().__call__(request)
         
         if not creds:
             return None
 
         token = creds.credentials
-        token_data = decode_token(token)
+        token_data = decode_token_cached(token)
 
-        if not self.token_valid(token):
+        if token_data is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Invalid or expired token",
@@ -45,10 +50,6 @@ class TokenBearer(HTTPBearer):
         self.verify_token_data(token_data)
         return token_data
 
-    def token_valid(self, token: str) -> bool:
-        token_data = decode_token(token)
-        return token_data is not None
-
     def verify_token_data(self, token_data):
         raise NotImplementedError("Please override this method in child classes")
 
@@ -112,7 +113,8 @@ async def get_current_user(
     
     # Get user from database using the service
     try:
-        user = await user_service.get_user_by_id(user_uuid, session)
+        with timed("auth"):
+            user = await user_service.get_user_by_id(user_uuid, session)
         
         if user is None:
             raise HTTPException(
@@ -159,6 +161,10 @@ class OptionalTokenBearer(HTTPBearer):
         super().__init__(auto_error=False)
 
     async def __call__(self, request: Request) -> Optional[dict]:
+        with timed("auth"):
+            return await self.authenticate(request)
+
+    async def authenticate(self, request: Request) -> Optional[dict]:
         try:
             creds = await super().__call__(request)
             
@@ -166,7 +172,7 @@ class OptionalTokenBearer(HTTPBearer):
                 return None
 
             token = creds.credentials
-            token_data = decode_token(token)
+            token_data = decode_token_cached(token)
 
             if not token_data:
                 return None
@@ -200,7 +206,7 @@ async def get_current_user_optional(
     
     try:
         # Extract user ID from token data
-        user_id: str = token_data.get("user", {}).get("uid") or token_data.get("sub")
+        user_id: str = token_data.get("user", {}).get("user_uid") or token_data.get("sub")
         
         if user_id is None:
             return None
@@ -5,7 +5,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session
 from app.core.database import get_session
 from sqlmodel.ext.asyncio.session import AsyncSession
-from .utils import create_access_token, verify_password
+from .utils import create_access_token, verify_and_update_password
 
 # from app.auth.schemas import Token, UserLogin
 from app.auth.services import UserService
@@ -54,9 +54,13 @@ async def login_users(
     user = await user_service.get_user_by_email(email, session)
 
     if user is not None:
-        password_valid = verify_password(password, user.password_hash)
+        password_valid, new_hash = await verify_and_update_password(password, user.password_hash)
 
         if password_valid:
+            if new_hash is not None:
+                # Made with another BCRYPT_ROUNDS; the plain password is only at hand now
+                await user_service.update_password_hash(user, new_hash, session)
+
             access_token = create_access_token(
                 user_data={
                     "email": user.email,
@@ -1,19 +1,24 @@
 import asyncio
 import uuid
 from sqlmodel import select
+from sqlalchemy import bindparam
 from app.models.user import User
 from app.auth.schemas import UserCreateModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import InterfaceError
-from .utils import generate_passwd_hash
+from .utils import hash_password
+
+
+# Built once and executed with the value as a parameter; these run on every login and token check
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).execution_options(query_name="users.by_email")
+USER_BY_ID = select(User).where(User.uid == bindparam("user_id")).execution_options(query_name="users.by_id")
 
 
 class UserService:
     async def get_user_by_email(self, email: str, session: AsyncSession, max_retries: int = 3):
         for attempt in range(max_retries):
             try:
-                statement = select(User).where(User.email == email)
-                result = await session.exec(statement)
+                result = await session.exec(USER_BY_EMAIL, params={"email": email})
                 user = result.first()
                 return user
             except InterfaceError as e:
@@ -29,8 +34,7 @@ class UserService:
     async def get_user_by_id(self, user_id: uuid.UUID, session: AsyncSession, max_retries: int = 3):
         for attempt in range(max_retries):
             try:
-                statement = select(User).where(User.uid == user_id)
-                result = await session.exec(statement)
+                result = await session.exec(USER_BY_ID, params={"user_id": user_id})
                 user = result.first()
                 return user
             except InterfaceError as e:
@@ -46,11 +50,13 @@ class UserService:
         return True if user is not None else False
 
     async def create_user(self, user_data: UserCreateModel, session: AsyncSession, max_retries: int = 3):
+        # Hashed once, outside the retries: it is the most expensive step
+        password_hash = await hash_password(user_data.password)
         for attempt in range(max_retries):
             try:
                 user_data_dict = user_data.model_dump()
                 new_user = User(**user_data_dict)
-                new_user.password_hash = generate_passwd_hash(user_data_dict["password"])
+                new_user.password_hash = password_hash
                 
                 session.add(new_user)
                 await session.commit()
@@ -63,4 +69,9 @@ class UserService:
                 raise
             except Exception:
                 await session.rollback()
-                raise
\ No newline at end of file
+                raise
+
+    async def update_password_hash(self, user: User, password_hash: str, session: AsyncSession):
+        user.password_hash = password_hash
+        session.add(user)
+        await session.commit()
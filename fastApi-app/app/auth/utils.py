@@ -1,24 +1,110 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple, TypeVar
+import asyncio
+import hashlib
 import logging
+import time
 import uuid
 import jwt
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
+from app.core.cache import LocalCache
 from app.core.config import settings as Config
+from app.core.timing import timed
 
 
-passwd_context = CryptContext(schemes=["bcrypt"])
+# Hashes made with any other cost are flagged by needs_update, so they are
+# replaced at the next login after BCRYPT_ROUNDS changes
+passwd_context = CryptContext(
+    schemes=["bcrypt"],
+    bcrypt__default_rounds=Config.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=Config.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=Config.BCRYPT_ROUNDS,
+)
 
 ACCESS_TOKEN_EXPIRY = 18000  # 5 hours in seconds
 
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a dedicated thread pool, so hashing never blocks the event loop.
+
+    bcrypt releases the GIL, so the threads hash in parallel with request
+    handling. At most `concurrency` hashes run at once; a caller waits up to
+    `queue_timeout` seconds for a slot and then gets a 503, so a burst of
+    logins turns into quick refusals instead of a queue that grows without bound.
+    """
+
+    def __init__(self, context: CryptContext, concurrency: int, queue_timeout: float):
+        self.context = context
+        self.concurrency = concurrency
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="password-hash")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # One semaphore per event loop; tests run each on a loop of its own
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._slots = loop, asyncio.Semaphore(self.concurrency)
+        return self._slots
+
+    async def run(self, function: Callable[..., T], *args) -> T:
+        slots = self._semaphore()
+        try:
+            await asyncio.wait_for(slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-ins in progress. Please try again.",
+                headers={"Retry-After": "1"},
+            )
+
+        try:
+            with timed("password"):
+                return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+        finally:
+            slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self.run(self.context.hash, password)
+
+    async def verify(self, password: str, hash: str) -> bool:
+        return await self.run(self.context.verify, password, hash)
+
+    async def verify_and_update(self, password: str, hash: str) -> Tuple[bool, Optional[str]]:
+        """Check a password; if it matches a hash made with outdated settings, also return its new hash"""
+        return await self.run(self.context.verify_and_update, password, hash)
+
+
+password_hasher = PasswordHasher(
+    passwd_context,
+    concurrency=Config.PASSWORD_HASH_CONCURRENCY,
+    queue_timeout=Config.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
+
 
 def generate_passwd_hash(password: str) -> str:
+    """Hash synchronously, for scripts; request handlers use hash_password"""
     hash = passwd_context.hash(password)
 
     return hash
 
 
+async def hash_password(password: str) -> str:
+    return await password_hasher.hash(password)
+
+
 async def verify_password(password: str, hash: str) -> bool:
-    return passwd_context.verify(password, hash)
+    return await password_hasher.verify(password, hash)
+
+
+async def verify_and_update_password(password: str, hash: str) -> Tuple[bool, Optional[str]]:
+    return await password_hasher.verify_and_update(password, hash)
 
 
 def create_access_token(
@@ -51,3 +137,29 @@ def decode_token(token: str) -> str:
     except jwt.PyJWTError as e:
         # logging.exception(e)
         return None
+
+
+# Claims of tokens that passed verification, by token digest. An entry expires
+# with its token, so a hit is exactly as valid as decoding again would be.
+verified_tokens = LocalCache(max_entries=Config.TOKEN_CACHE_MAX_ENTRIES, ttl=0)
+
+
+def decode_token_cached(token: str) -> Optional[dict]:
+    """
+    decode_token, verifying each token only the first time it is seen.
+
+    The claims are shared between requests and must not be modified.
+    Revocation is not cached; callers still check the blocklist.
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    token_data = verified_tokens.get(key)
+    if token_data is not None:
+        return token_data
+
+    token_data = decode_token(token)
+    if token_data is not None and "exp" in token_data:
+        # PyJWT checks exp against the wall clock, so the ttl is measured on it too
+        ttl = token_data["exp"] - time.time()
+        if ttl > 0:
+            verified_tokens.set(key, token_data, ttl=ttl)
+    return token_data
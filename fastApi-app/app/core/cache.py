@@ -0,0 +1,332 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set
+
+from fastapi import Request, Response
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings as Config
+from app.core.database import async_engine
+from app.core.http_cache import gzip_etag
+from app.core.redis import redis_client
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "cache:v1"
+
+# How long to stop talking to Redis after it fails, so an outage costs one error
+# per interval instead of one per request
+FAILURE_BACKOFF_SECONDS = 5
+
+# Postgres NOTIFY payloads are limited to 8000 bytes; bigger invalidations
+# are sent as a request to clear everything
+NOTIFY_PAYLOAD_LIMIT = 7900
+CLEAR_ALL = "*"
+
+
+class CachedResponse(NamedTuple):
+    body: bytes  # gzip-compressed JSON
+    headers: Dict[str, str]
+
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None, status_code: int = 200) -> Response:
+    """Response for an already serialized JSON body"""
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry expiry and tag invalidation.
+
+    Not shared between workers; see ResponseCache for how workers are kept in step.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (value, expires_at, tags)
+        self._tags: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = (), ttl: Optional[float] = None) -> None:
+        if self.max_entries <= 0:
+            return
+
+        self.delete(key)
+        tags = tuple(tags)
+        self._entries[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl), tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self.delete(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate(self, *tags: str) -> None:
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+
+class ResponseCache:
+    """
+    Two-tier cache of serialized, gzip-compressed JSON responses.
+
+    Entries live in a per-worker LocalCache in front of Redis. Every entry is
+    registered under one or more tags (a Redis set of keys), so a write can
+    drop exactly the entries it affects by invalidating their tags. Once the
+    Redis entries are gone, the invalidation is announced with Postgres
+    NOTIFY on `notify_engine` so the other workers evict their local copies;
+    announcing it any earlier would let them copy the stale Redis entry
+    straight back. The cache fails open: if Redis is unavailable requests go
+    to the database.
+
+    With `repeat_after` set, every invalidation is repeated after that many
+    seconds, dropping entries filled from a read replica that had not yet
+    replayed the write.
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl: int,
+        enabled: bool = True,
+        local: Optional[LocalCache] = None,
+        repeat_after: float = 0,
+        notify_engine: Optional[AsyncEngine] = None,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.enabled = enabled
+        self.local = local
+        self.repeat_after = repeat_after
+        self.notify_engine = notify_engine
+        self._disabled_until = 0.0
+        self._repeats: Set[asyncio.Task] = set()
+
+    def key(self, namespace: str, params: Dict[str, Any]) -> str:
+        """Build a cache key from a namespace and normalized request parameters"""
+        normalized = {
+            name: getattr(value, "value", value)
+            for name, value in params.items()
+            if value is not None
+        }
+        digest = hashlib.sha1(
+            json.dumps(normalized, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{CACHE_PREFIX}:{namespace}:{digest}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{CACHE_PREFIX}:tag:{tag}"
+
+    def _available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._disabled_until
+
+    def _failed(self, error: Exception) -> None:
+        logger.warning("Response cache unavailable: %s", error)
+        self._disabled_until = time.monotonic() + FAILURE_BACKOFF_SECONDS
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        if not self.enabled:
+            return None
+
+        if self.local is not None:
+            cached = self.local.get(key)
+            if cached is not None:
+                return cached
+
+        if not self._available():
+            return None
+
+        try:
+            entry = await self.client.hgetall(key)
+        except RedisError as e:
+            self._failed(e)
+            return None
+
+        if not entry:
+            return None
+
+        cached = CachedResponse(
+            body=entry[b"body"],
+            headers=json.loads(entry[b"headers"]),
+        )
+        if self.local is not None:
+            self.local.set(key, cached, tags=json.loads(entry.get(b"tags", b"[]")))
+        return cached
+
+    async def set(
+        self,
+        key: str,
+        body: bytes,
+        tags: Iterable[str],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        tags = list(tags)
+        cached = CachedResponse(body=gzip.compress(body, mtime=0), headers=headers or {})
+        if self.local is not None:
+            self.local.set(key, cached, tags=tags)
+
+        if not self._available():
+            return
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hset(key, mapping={
+                "body": cached.body,
+                "headers": json.dumps(cached.headers),
+                "tags": json.dumps(tags),
+            })
+            pipe.expire(key, self.ttl)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), key)
+                pipe.expire(self._tag_key(tag), self.ttl)
+            await pipe.execute()
+        except RedisError as e:
+            self._failed(e)
+
+    async def invalidate(self, *tags: str, repeat: bool = True) -> None:
+        """
+        Drop every entry registered under any of the given tags, here, in
+        Redis and then in the other workers. Call it after the write commits.
+        """
+        if not self.enabled:
+            return
+
+        self.invalidate_local(*tags)
+
+        if repeat and self.repeat_after > 0:
+            task = asyncio.create_task(self._invalidate_later(tags))
+            self._repeats.add(task)
+            task.add_done_callback(self._repeats.discard)
+
+        if self._available():
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            try:
+                keys = await self.client.sunion(tag_keys)
+                await self.client.delete(*keys, *tag_keys)
+            except RedisError as e:
+                self._failed(e)
+
+        await self.publish_invalidation(*tags)
+
+    async def _invalidate_later(self, tags: Iterable[str]) -> None:
+        await asyncio.sleep(self.repeat_after)
+        await self.invalidate(*tags, repeat=False)
+
+    def invalidate_local(self, *tags: str) -> None:
+        """Drop this worker's local copies of the entries under the given tags"""
+        if self.local is None:
+            return
+
+        if CLEAR_ALL in tags:
+            self.local.clear()
+        else:
+            self.local.invalidate(*tags)
+
+    def handle_notification(self, payload: str) -> None:
+        """Apply an invalidation announced by another worker"""
+        try:
+            tags = json.loads(payload)
+        except ValueError:
+            tags = [CLEAR_ALL]
+        self.invalidate_local(*tags)
+
+    async def publish_invalidation(self, *tags: str) -> None:
+        """
+        Announce an invalidation to every worker with NOTIFY, in a transaction
+        of its own. The write has already committed, so a failure is logged
+        rather than raised; the local copies then expire with their TTL.
+        """
+        if self.notify_engine is None:
+            return
+
+        payload = json.dumps(list(tags))
+        if len(payload) > NOTIFY_PAYLOAD_LIMIT:
+            payload = json.dumps([CLEAR_ALL])
+
+        try:
+            async with self.notify_engine.begin() as conn:
+                await conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": Config.CACHE_INVALIDATION_CHANNEL, "payload": payload},
+                )
+        except Exception as e:
+            logger.warning("Could not announce cache invalidation: %s", e)
+
+    def representation_headers(self, entry: CachedResponse, request: Request) -> Dict[str, str]:
+        """Headers of the variant of a cached entry this client gets: gzip if it accepts it"""
+        headers = {**entry.headers, "Vary": "Accept-Encoding"}
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            if "ETag" in headers:
+                headers["ETag"] = gzip_etag(headers["ETag"])
+        return headers
+
+    def render(
+        self,
+        entry: CachedResponse,
+        request: Request,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """Serve a cached entry, passing the gzip body through when the client accepts it"""
+        headers = {**self.representation_headers(entry, request), **(extra_headers or {})}
+
+        if headers.get("Content-Encoding") == "gzip":
+            return json_response(entry.body, headers)
+
+        return json_response(gzip.decompress(entry.body), headers)
+
+
+response_cache = ResponseCache(
+    redis_client,
+    ttl=Config.CACHE_TTL_SECONDS,
+    enabled=Config.CACHE_ENABLED,
+    local=LocalCache(
+        max_entries=Config.LOCAL_CACHE_MAX_ENTRIES,
+        ttl=Config.LOCAL_CACHE_TTL_SECONDS,
+    ),
+    repeat_after=Config.READ_REPLICA_MAX_LAG_SECONDS if Config.READ_REPLICA_URL else 0,
+    notify_engine=async_engine if async_engine.dialect.name == "postgresql" else None,
+)
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
@@ -10,13 +10,56 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Optional read replica for the public GET routes
+    READ_REPLICA_URL: Optional[str] = None
+    READ_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    READ_REPLICA_LAG_CHECK_SECONDS: float = 2.0
+    # After a write, the same client reads from the primary for this long
+    READ_YOUR_WRITES_SECONDS: int = 10
+    # asyncpg prepared statements kept per connection, keyed by SQL text
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
 
+    # Response cache
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: int = 300
+    LOCAL_CACHE_MAX_ENTRIES: int = 1024
+    LOCAL_CACHE_TTL_SECONDS: int = 30
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
+
+    # HTTP caching: Cache-Control value per route policy
+    CACHE_CONTROL_POLICIES: Dict[str, str] = {
+        "universities.list": "public, max-age=60, must-revalidate",
+        "universities.detail": "public, max-age=300, must-revalidate",
+        "universities.programs": "public, max-age=300, must-revalidate",
+        "universities.enums": "public, max-age=86400, immutable",
+    }
+
+    # Total counts: the "capped" mode stops counting past this many matches
+    LIST_COUNT_CAP: int = 1000
+
+    # Prometheus metrics on /metrics
+    METRICS_ENABLED: bool = True
+
+    # Requests slower than this are logged with their Server-Timing breakdown
+    SLOW_REQUEST_LOG_SECONDS: Optional[float] = None
+
+    # Statistics
+    STATISTICS_USE_MATERIALIZED_VIEW: bool = False
+    STATISTICS_REFRESH_SECONDS: int = 300
+
     # Security
     JWT_SECRET: str
     JWT_ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # bcrypt cost; existing hashes are upgraded at the next login after a change
+    BCRYPT_ROUNDS: int = 12
+    # Hashes computed at once per worker, and how long a request waits for a turn
+    PASSWORD_HASH_CONCURRENCY: int = 2
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 5.0
+    # Verified tokens remembered per worker, so repeat requests skip the signature check
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
 
     # CORS
     CORS_ORIGINS: List[str] = ["*"]
@@ -1,7 +1,15 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+from fastapi import Depends, Request
 from sqlmodel import SQLModel
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy import event, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings as Config
+from app.core.metrics import TimedQueuePool, instrument_engine
 
 # Create the async engine with proper connection handling
 async_engine = create_async_engine(
@@ -14,15 +22,20 @@ async_engine = create_async_engine(
     pool_pre_ping=True,          # Test connections before use (FIXES YOUR ISSUE!)
     pool_recycle=300,            # Recycle connections every 5 minutes (300 seconds)
     pool_timeout=30,             # Timeout when getting connection from pool
+    poolclass=TimedQueuePool,    # Records checkout waits for /metrics
+    pool_logging_name="primary",
     
     # Additional connection handling
     connect_args={
         "server_settings": {
             "application_name": "fastapi_app",
-        }
+        },
+        "prepared_statement_cache_size": Config.DB_PREPARED_STATEMENT_CACHE_SIZE,
     }
 )
 
+instrument_engine(async_engine, "primary")
+
 # Create session factory using the new async_sessionmaker
 async_session_maker = async_sessionmaker(
     bind=async_engine,
@@ -30,13 +43,107 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False
 )
 
+logger = logging.getLogger(__name__)
+
+# Delay before re-establishing a dropped LISTEN connection
+LISTEN_RETRY_SECONDS = 5
+
+# Cookie marking a client that has just written, so its reads see the write
+READ_YOUR_WRITES_COOKIE = "read_primary_until"
+
+
+class ReplicaLag:
+    """
+    Decides whether a read replica is fresh enough to serve reads.
+
+    Replication lag is measured at most once per `check_interval`; a replica
+    that cannot be reached or is further behind than `max_lag` is skipped
+    until the next measurement.
+    """
+
+    def __init__(self, engine: AsyncEngine, max_lag: float, check_interval: float):
+        self.engine = engine
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lag: Optional[float] = None
+        self._checked_at = float("-inf")
+
+    async def measure(self) -> float:
+        if self.engine.dialect.name != "postgresql":
+            return 0.0
+
+        async with self.engine.connect() as conn:
+            result = await conn.execute(text(
+                "SELECT CASE"
+                " WHEN NOT pg_is_in_recovery() THEN 0"
+                " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+                " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+                " END"
+            ))
+            return float(result.scalar() or 0)
+
+    async def acceptable(self) -> bool:
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            # Claim the check first so concurrent requests do not all measure
+            self._checked_at = now
+            try:
+                self._lag = await self.measure()
+            except Exception as e:
+                logger.warning("Read replica unavailable: %s", e)
+                self._lag = None
+
+            if self._lag is not None and self._lag > self.max_lag:
+                logger.warning("Read replica is %.1fs behind, reading from the primary", self._lag)
+
+        return self._lag is not None and self._lag <= self.max_lag
+
+
+def create_read_engine(url: str) -> AsyncEngine:
+    connect_args = {}
+    if make_url(url).get_backend_name() == "postgresql":
+        connect_args["server_settings"] = {"application_name": "fastapi_app_read"}
+        connect_args["prepared_statement_cache_size"] = Config.DB_PREPARED_STATEMENT_CACHE_SIZE
+
+    return create_async_engine(
+        url=url,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        pool_timeout=30,
+        poolclass=TimedQueuePool,
+        pool_logging_name="read",
+        connect_args=connect_args,
+    )
+
+
+read_engine: Optional[AsyncEngine] = None
+read_session_maker: Optional[async_sessionmaker] = None
+replica_lag: Optional[ReplicaLag] = None
+
+if Config.READ_REPLICA_URL:
+    read_engine = create_read_engine(Config.READ_REPLICA_URL)
+    instrument_engine(read_engine, "read")
+    read_session_maker = async_sessionmaker(bind=read_engine, class_=AsyncSession, expire_on_commit=False)
+    replica_lag = ReplicaLag(
+        read_engine,
+        max_lag=Config.READ_REPLICA_MAX_LAG_SECONDS,
+        check_interval=Config.READ_REPLICA_LAG_CHECK_SECONDS,
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_commit(session: Session) -> None:
+    session.info["committed"] = True
+
 
 async def init_db():
     async with async_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
-async def get_session() -> AsyncSession:
+async def get_session(request: Request) -> AsyncSession:
     """
     Dependency function to get database session
     """
@@ -47,9 +154,78 @@ async def get_session() -> AsyncSession:
             await session.rollback()
             raise
         finally:
+            mark_primary_write(request, session)
             await session.close()
 
 
+def mark_primary_write(request: Request, session: AsyncSession) -> None:
+    """Flag the request for ReadYourWritesMiddleware if its session committed"""
+    if session.info.get("committed"):
+        request.state.wrote_primary = True
+
+
+async def get_read_session(
+    request: Request,
+    primary: AsyncSession = Depends(get_session)
+) -> AsyncSession:
+    """
+    Session for read-only work: the read replica when one is configured and
+    fresh enough, otherwise the primary session.
+
+    Clients that wrote within READ_YOUR_WRITES_SECONDS stay on the primary so
+    they see their own writes. The primary session only takes a connection
+    if it is actually used.
+    """
+    if read_session_maker is None or primary_required(request) or not await replica_lag.acceptable():
+        yield primary
+        return
+
+    async with read_session_maker() as session:
+        yield session
+
+
+def primary_required(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    Set the read-your-writes cookie on responses to requests that committed
+    to the primary, so the client's next reads skip the replica
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or read_session_maker is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and scope.get("state", {}).get("wrote_primary"):
+                until = int(time.time()) + Config.READ_YOUR_WRITES_SECONDS
+                cookie = (
+                    f"{READ_YOUR_WRITES_COOKIE}={until}; Max-Age={Config.READ_YOUR_WRITES_SECONDS}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def get_session_maker() -> async_sessionmaker:
+    """
+    Dependency returning the session factory itself, for responses that need a
+    session after the route returns (e.g. streaming) and so manage their own
+    """
+    return async_session_maker
+
+
 # Alternative session dependency with retry logic
 async def get_session_with_retry() -> AsyncSession:
     """
@@ -70,4 +246,44 @@ async def get_session_with_retry() -> AsyncSession:
                 continue
             raise
         except Exception:
-            raise
\ No newline at end of file
+            raise
+
+
+async def listen(
+    channel: str,
+    on_message: Callable[[str], None],
+    on_reconnect: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Deliver Postgres NOTIFY payloads on `channel` to `on_message` until cancelled.
+
+    Holds one dedicated connection from the engine's pool. If it drops, the
+    connection is re-established and `on_reconnect` is called, since any
+    notifications sent in the meantime were lost.
+    """
+    first_attempt = True
+    while True:
+        try:
+            async with async_engine.connect() as conn:
+                raw_connection = await conn.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                closed = asyncio.Event()
+
+                await driver_connection.add_listener(
+                    channel, lambda _conn, _pid, _channel, payload: on_message(payload)
+                )
+                driver_connection.add_termination_listener(lambda _conn: closed.set())
+
+                if not first_attempt and on_reconnect is not None:
+                    on_reconnect()
+                first_attempt = False
+
+                await closed.wait()
+                logger.warning("LISTEN connection for %s was closed", channel)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("LISTEN on %s failed: %s", channel, e)
+            first_attempt = False
+
+        await asyncio.sleep(LISTEN_RETRY_SECONDS)
@@ -0,0 +1,75 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.core.config import settings as Config
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag derived from everything the representation depends on"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def gzip_etag(etag: str) -> str:
+    """ETag of the gzip-encoded variant of a representation: its bytes differ, so its strong tag must too"""
+    return f'{etag[:-1]}-gzip"'
+
+
+def cache_control(policy: str) -> Dict[str, str]:
+    """Cache-Control header for a named policy from settings, if one is configured"""
+    value = Config.CACHE_CONTROL_POLICIES.get(policy)
+    return {"Cache-Control": value} if value else {}
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        # Timestamps are stored as naive server-local times
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against a response's validators.
+
+    If-None-Match takes precedence when present, as required by RFC 9110.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = headers.get("ETag")
+        if etag is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison, and either encoding of the representation will do
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in candidates or gzip_etag(etag) in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = headers.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(headers: Dict[str, str], request: Optional[Request] = None) -> Response:
+    """
+    304 carrying the validators and caching headers of the full response.
+
+    A client revalidating the gzip variant gets that variant's ETag back.
+    """
+    keep = ("ETag", "Last-Modified", "Cache-Control", "Vary")
+    headers = {name: value for name, value in headers.items() if name in keep}
+    etag = headers.get("ETag")
+    if request is not None and etag is not None and gzip_etag(etag) in request.headers.get("if-none-match", ""):
+        headers["ETag"] = gzip_etag(etag)
+    return Response(status_code=304, headers=headers)
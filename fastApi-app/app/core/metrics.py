@@ -0,0 +1,283 @@
+"""
+Process metrics in the Prometheus text exposition format.
+
+Connection pool, statement, Redis and request timings are recorded in
+memory and rendered on demand by the /metrics route, so a scrape costs one
+pass over the recorded series and no I/O. Metrics are per worker process;
+Prometheus adds them up across workers.
+"""
+import bisect
+import time
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds, for database and Redis round trips and for whole requests
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Route label for requests that matched no route, so stray paths cannot add series
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            yield f"{self.name}{_labels(self.labelnames, key)} {_number(value)}"
+
+
+class Gauge(Metric):
+    """Gauge read from a callback at scrape time, one callback per label set"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._functions: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        self._functions[self._key(labels)] = function
+
+    def samples(self) -> Iterable[str]:
+        for key, function in self._functions.items():
+            yield f"{self.name}{_labels(self.labelnames, key)} {_number(function())}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = QUERY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [count per bucket (non-cumulative, last is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def count(self, **labels: str) -> int:
+        """Observations with the given label values, summed over any labels left out"""
+        wanted = [(index, str(labels[name])) for index, name in enumerate(self.labelnames) if name in labels]
+        return sum(
+            sum(counts)
+            for key, (counts, _) in self._series.items()
+            if all(key[index] == value for index, value in wanted)
+        )
+
+    def samples(self) -> Iterable[str]:
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> bytes:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return ("\n".join(lines) + "\n").encode()
+
+
+registry = Registry()
+
+pool_checked_out = registry.register(Gauge(
+    "db_pool_checked_out_connections", "Connections currently checked out of the pool", ["engine"]
+))
+pool_overflow = registry.register(Gauge(
+    "db_pool_overflow_connections", "Connections open beyond pool_size", ["engine"]
+))
+pool_size = registry.register(Gauge(
+    "db_pool_size", "Connections the pool keeps open", ["engine"]
+))
+pool_checkout_wait = registry.register(Histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection", ["engine"]
+))
+pool_timeouts = registry.register(Counter(
+    "db_pool_timeouts_total", "Checkouts that gave up after pool_timeout", ["engine"]
+))
+statement_duration = registry.register(Histogram(
+    "db_statement_duration_seconds", "Statement execution time by query name", ["engine", "query_name"]
+))
+redis_duration = registry.register(Histogram(
+    "redis_command_duration_seconds", "Redis round trip time by command", ["command"]
+))
+request_duration = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "Request handling time by route template",
+    ["method", "route", "status"],
+    buckets=REQUEST_BUCKETS,
+))
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long each checkout waits for a connection.
+
+    The engine label comes from the pool's logging name (pool_logging_name),
+    which survives the pool being recreated.
+    """
+
+    def _do_get(self):
+        engine = self._orig_logging_name or "default"
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_timeouts.inc(engine=engine)
+            raise
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - start, engine=engine)
+
+
+def query_name(context, statement: str) -> str:
+    """
+    The `query_name` execution option of a statement, else its SQL verb.
+
+    Name hot statements with .execution_options(query_name=...) to get
+    their own series.
+    """
+    name = context.execution_options.get("query_name") if context is not None else None
+    if name:
+        return name
+    verb = statement.lstrip().split(None, 1)
+    return verb[0].lower() if verb else "empty"
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """Record statement timings for an engine and expose its pool state"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _record_duration(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_metrics_start", None)
+        if start is not None:
+            statement_duration.observe(
+                time.perf_counter() - start, engine=name, query_name=query_name(context, statement)
+            )
+
+    # Read the current pool at scrape time; dispose() replaces it
+    if isinstance(sync_engine.pool, AsyncAdaptedQueuePool):
+        pool_checked_out.set_function(lambda: sync_engine.pool.checkedout(), engine=name)
+        pool_overflow.set_function(lambda: max(sync_engine.pool.overflow(), 0), engine=name)
+        pool_size.set_function(lambda: sync_engine.pool.size(), engine=name)
+
+
+class MetricsMiddleware:
+    """Record the latency of every HTTP request under its route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            request_duration.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=getattr(route, "path", UNMATCHED_ROUTE),
+                status=str(status_code),
+            )
+
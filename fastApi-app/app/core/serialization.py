@@ -0,0 +1,26 @@
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from app.core.timing import timed
+
+
+class Serializer:
+    """
+    Precompiled validator and JSON encoder for one response type.
+
+    Validating with from_attributes reads ORM objects and result rows directly,
+    so a response is validated once, inside pydantic-core, and dumped straight
+    to JSON bytes; routes return those bytes instead of models that FastAPI
+    would validate and encode a second time through `response_model`.
+    """
+
+    def __init__(self, response_type: Any):
+        self.adapter = TypeAdapter(response_type)
+
+    def validate(self, value: Any) -> Any:
+        return self.adapter.validate_python(value, from_attributes=True)
+
+    def dump(self, value: Any) -> bytes:
+        with timed("serialize"):
+            return self.adapter.dump_json(self.validate(value))
@@ -0,0 +1,137 @@
+"""
+Per-request breakdown of where the time went, as a Server-Timing header.
+
+ServerTimingMiddleware puts a RequestTimings in a context variable for the
+duration of each request. Database statements (through cursor events on
+every engine), Redis commands, authentication and serialization add their
+durations to it, and the middleware reports them on the response and, for
+slow requests, in a log line.
+"""
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings as Config
+
+
+logger = logging.getLogger(__name__)
+
+# Timing name -> description in the header
+TIMING_DESCRIPTIONS = {
+    "db": "Database",
+    "redis": "Redis",
+    "auth": "Authentication",
+    "password": "Password hashing",
+    "serialize": "Serialization",
+}
+
+
+class RequestTimings:
+    """Total duration and number of operations per timing name, for one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def header(self) -> str:
+        entries = [
+            f'{name};dur={seconds * 1000:.2f};desc="{TIMING_DESCRIPTIONS.get(name, name)} ({self.counts[name]})"'
+            for name, seconds in self.durations.items()
+        ]
+        entries.append(f"total;dur={self.elapsed() * 1000:.2f}")
+        return ", ".join(entries)
+
+
+request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Add a duration to the current request's timings, if there is a request"""
+    timings = request_timings.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - start)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and request_timings.get() is not None:
+        context._timing_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_statement(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_timing_start", None)
+    if start is not None:
+        record_timing("db", time.perf_counter() - start)
+
+
+class ServerTimingMiddleware:
+    """
+    Add a Server-Timing header to every response, and log requests slower
+    than SLOW_REQUEST_LOG_SECONDS with their timings
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        status_code = 500
+
+        async def send_with_timings(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.header().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            request_timings.reset(token)
+            threshold = Config.SLOW_REQUEST_LOG_SECONDS
+            if threshold is not None and timings.elapsed() >= threshold:
+                log_slow_request(scope, status_code, timings)
+
+
+def log_slow_request(scope, status_code: int, timings: RequestTimings) -> None:
+    route = scope.get("route")
+    logger.warning("slow request %s", json.dumps({
+        "method": scope["method"],
+        "path": scope["path"],
+        "route": getattr(route, "path", None),
+        "status": status_code,
+        "duration_ms": round(timings.elapsed() * 1000, 2),
+        "timings_ms": {name: round(seconds * 1000, 2) for name, seconds in timings.durations.items()},
+        "counts": timings.counts,
+    }))
@@ -1,8 +1,13 @@
-from fastapi import FastAPI
+import asyncio
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import init_db, listen, async_engine, ReadYourWritesMiddleware
+from app.core.cache import response_cache
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, registry
+from app.core.timing import ServerTimingMiddleware
+from app.services.statistics import statistics_view_enabled, refresh_statistics_periodically
 from app.auth.routes import auth_router
 from app.api.routes import universities
 
@@ -11,7 +16,28 @@ from app.api.routes import universities
 async def life_span(app: FastAPI):
     print(f"Server is starting ...")
     await init_db()
+
+    # Evict this worker's local cache entries when another worker writes
+    cache_listener = None
+    if settings.CACHE_ENABLED and async_engine.dialect.name == "postgresql":
+        cache_listener = asyncio.create_task(listen(
+            settings.CACHE_INVALIDATION_CHANNEL,
+            response_cache.handle_notification,
+            on_reconnect=response_cache.local.clear,
+        ))
+
+    # Refresh the statistics view on a schedule as well as after admin writes
+    statistics_refresher = None
+    if statistics_view_enabled():
+        statistics_refresher = asyncio.create_task(
+            refresh_statistics_periodically(settings.STATISTICS_REFRESH_SECONDS)
+        )
+
     yield
+
+    for task in (cache_listener, statistics_refresher):
+        if task is not None:
+            task.cancel()
     print(f"Server has been stopped ...")
 
 
@@ -30,8 +56,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag", "Last-Modified", "Server-Timing"],
 )
 
+# Send clients that just wrote to the primary for their next reads
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Break each response's time down into database, Redis, auth and serialization
+app.add_middleware(ServerTimingMiddleware)
+
+# Time every request; added last so it wraps the other middleware
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth_router, prefix=f"/api/v1/auth", tags=["auth"])
 app.include_router(universities.router)
@@ -50,3 +87,10 @@ def read_root():
 def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Prometheus scrape endpoint"""
+        return Response(content=registry.render(), media_type=METRICS_CONTENT_TYPE)
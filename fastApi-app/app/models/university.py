@@ -3,6 +3,8 @@ from sqlmodel import Column, Relationship, SQLModel, Field
 from typing import List, Optional
 from datetime import datetime
 import sqlalchemy.dialects.postgresql as pg
+from sqlalchemy import Index, case, literal_column, text
+from sqlalchemy.sql.elements import Grouping
 from enum import Enum
 
 
@@ -35,9 +37,63 @@ class Language(str, Enum):
     AFRIKAANS = "Afrikaans"
 
 
+class UniversitySort(str, Enum):
+    NAME = "name"
+    NAME_DESC = "-name"
+    RANKING = "ranking"  # best first
+    RANKING_DESC = "-ranking"
+    TUITION = "tuition"
+    TUITION_DESC = "-tuition"
+    ACCEPTANCE_RATE = "acceptance_rate"
+    ACCEPTANCE_RATE_DESC = "-acceptance_rate"
+    FOUNDED_YEAR = "founded_year"
+    FOUNDED_YEAR_DESC = "-founded_year"
+    NIGERIAN_STUDENTS = "nigerian_students"
+    NIGERIAN_STUDENTS_DESC = "-nigerian_students"
+
+
 # Database Models
 class University(SQLModel, table=True):
     __tablename__ = "universities"
+    __table_args__ = (
+        # Serves keyset pagination of the public list (ORDER BY name, uid)
+        Index(
+            "ix_universities_active_name_uid",
+            "name",
+            "uid",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        # Country and city facet groupings. The list's country and city filters
+        # are ILIKE '%x%' patterns, which a btree cannot serve; on Postgres the
+        # pg_trgm GIN indexes from migration 8f3a2d61c0b7 do.
+        Index(
+            "ix_universities_active_country_city",
+            "country",
+            "city",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        # Equality filters on university type, alone or with ranking
+        Index(
+            "ix_universities_active_type_ranking",
+            "university_type",
+            "ranking",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        # One index per numeric sort order of the list, each ending in uid for keyset paging
+        *(
+            Index(
+                f"ix_universities_active_{column}_uid",
+                column,
+                "uid",
+                postgresql_where=text("is_active"),
+                sqlite_where=text("is_active = 1"),
+            )
+            for column in ("average_annual_tuition", "acceptance_rate", "founded_year", "nigerian_students")
+        ),
+    )
     
     uid: uuid.UUID = Field(
         sa_column=Column(
@@ -55,7 +111,8 @@ class University(SQLModel, table=True):
     city: str = Field(max_length=100, nullable=False)
     founded_year: Optional[int] = Field(default=None)
     university_type: UniversityType = Field(nullable=False)
-    ranking: Ranking = Field(default=Ranking.NOT_RANKED)
+    # A ranking filter alone cannot use ix_universities_active_type_ranking
+    ranking: Ranking = Field(default=Ranking.NOT_RANKED, index=True)
     description: Optional[str] = Field(default=None)
     
     # Statistics
@@ -84,7 +141,8 @@ class University(SQLModel, table=True):
         sa_column=Column(pg.TIMESTAMP, default=datetime.now)
     )
     updated_at: datetime = Field(
-        sa_column=Column(pg.TIMESTAMP, default=datetime.now, onupdate=datetime.now)
+        # Lets the list's change probe read max(updated_at) from the end of the index
+        sa_column=Column(pg.TIMESTAMP, default=datetime.now, onupdate=datetime.now, index=True)
     )
     
     # Relationships
@@ -94,8 +152,61 @@ class University(SQLModel, table=True):
         return f"<University {self.name}>"
 
 
+# Position of a university's ranking, best first. Rankings are stored by member
+# name, which does not sort in rank order; literals are inlined so that the
+# sort matches ix_universities_active_ranking_order_uid.
+university_ranking_order = case(
+    *[
+        (University.ranking == literal_column(f"'{ranking.name}'"), literal_column(str(position)))
+        for position, ranking in enumerate(Ranking)
+    ],
+    else_=literal_column(str(len(Ranking))),
+)
+
+Index(
+    "ix_universities_active_ranking_order_uid",
+    # Postgres requires expression index columns to be parenthesized
+    Grouping(university_ranking_order),
+    University.uid,
+    postgresql_where=text("is_active"),
+    sqlite_where=text("is_active = 1"),
+)
+
+
 class AcademicProgram(SQLModel, table=True):
     __tablename__ = "academic_programs"
+    __table_args__ = (
+        # Serve the cross-university program search: keyset order (name, uid),
+        # optionally narrowed by degree type, plus faculty/department and tuition filters
+        Index(
+            "ix_academic_programs_active_name_uid",
+            "name",
+            "uid",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        Index(
+            "ix_academic_programs_active_degree_name_uid",
+            "degree_type",
+            "name",
+            "uid",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        Index(
+            "ix_academic_programs_active_faculty_department",
+            "faculty",
+            "department",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        Index(
+            "ix_academic_programs_active_tuition",
+            "tuition_fee",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
     
     uid: uuid.UUID = Field(
         sa_column=Column(
@@ -119,7 +230,9 @@ class AcademicProgram(SQLModel, table=True):
     tuition_fee: Optional[float] = Field(default=None)  # in USD
     
     # Foreign Key
-    university_uid: uuid.UUID = Field(foreign_key="universities.uid")
+    # Serves the programs of a university, active or not: the detail view,
+    # the programs endpoint and (de)activation
+    university_uid: uuid.UUID = Field(foreign_key="universities.uid", index=True)
     
     # Metadata
     is_active: bool = Field(default=True)
@@ -164,6 +277,12 @@ class AcademicProgramResponse(AcademicProgramBase):
         from_attributes = True
 
 
+class ProgramSearchResult(AcademicProgramResponse):
+    university_name: str
+    university_country: str
+    university_city: str
+
+
 class UniversityBase(SQLModel):
     name: str = Field(max_length=255)
     website: Optional[str] = Field(default=None, max_length=255)
@@ -234,3 +353,78 @@ class UniversityListResponse(SQLModel):
 
     class Config:
         from_attributes = True
+
+
+class FacetCount(SQLModel):
+    value: str
+    count: int
+
+
+class UniversityFacets(SQLModel):
+    """Result counts per filter option, each computed under all the other active filters"""
+    total: int = 0
+    country: List[FacetCount] = Field(default=[])
+    university_type: List[FacetCount] = Field(default=[])
+    ranking: List[FacetCount] = Field(default=[])
+    offers_scholarships: List[FacetCount] = Field(default=[])
+    provides_accommodation: List[FacetCount] = Field(default=[])
+
+
+class UniversityFacetedResponse(SQLModel):
+    results: List[UniversityListResponse] = Field(default=[])
+    facets: UniversityFacets
+
+
+class UniversityImportError(SQLModel):
+    row: int
+    error: str
+
+
+class UniversityImportReport(SQLModel):
+    received: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[UniversityImportError] = Field(default=[])
+
+
+class UniversityFilter(SQLModel):
+    """Selects universities by the same criteria as the public list"""
+    country: Optional[str] = Field(default=None)
+    city: Optional[str] = Field(default=None)
+    university_type: Optional[UniversityType] = Field(default=None)
+    ranking: Optional[Ranking] = Field(default=None)
+    offers_scholarships: Optional[bool] = Field(default=None)
+    provides_accommodation: Optional[bool] = Field(default=None)
+    search: Optional[str] = Field(default=None)
+    min_tuition: Optional[float] = Field(default=None)
+    max_tuition: Optional[float] = Field(default=None)
+    min_acceptance_rate: Optional[float] = Field(default=None)
+    max_acceptance_rate: Optional[float] = Field(default=None)
+    min_founded_year: Optional[int] = Field(default=None)
+    max_founded_year: Optional[int] = Field(default=None)
+    min_nigerian_students: Optional[int] = Field(default=None)
+    max_nigerian_students: Optional[int] = Field(default=None)
+
+
+class UniversityBulkUpdateItem(SQLModel):
+    uid: uuid.UUID
+    fields: UniversityUpdate
+
+
+class UniversityBulkUpdate(SQLModel):
+    # Either per-university updates, or one set of fields for every match of a filter
+    updates: Optional[List[UniversityBulkUpdateItem]] = Field(default=None)
+    filter: Optional[UniversityFilter] = Field(default=None)
+    fields: Optional[UniversityUpdate] = Field(default=None)
+
+
+class UniversityBulkUpdateResult(SQLModel):
+    updated: int = 0
+    uids: List[uuid.UUID] = Field(default=[])
+    not_found: List[uuid.UUID] = Field(default=[])
+
+
+class UniversityBulkStatus(SQLModel):
+    # Either explicit uids, or a filter selecting the universities to change
+    uids: Optional[List[uuid.UUID]] = Field(default=None)
+    filter: Optional[UniversityFilter] = Field(default=None)
@@ -16,7 +16,7 @@ class User(SQLModel, table=True):
         )
     )
     username: str
-    email: str
+    email: str = Field(index=True)
     last_name: str
     role: str = Field(
         sa_column=Column(pg.VARCHAR, nullable=False, default="regular")
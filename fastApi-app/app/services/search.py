@@ -0,0 +1,76 @@
+from sqlalchemy import and_, case, func, literal, literal_column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.university import University
+
+
+# The document expression must stay in step with ix_universities_search_document,
+# and its literals are inlined rather than bound, so that Postgres can use the index
+TS_CONFIG = literal_column("'simple'")
+EMPTY = literal_column("''")
+SPACE = literal_column("' '")
+
+
+def university_search_document() -> ColumnElement:
+    """Weighted tsvector over name (A), city/country (B) and description (C)"""
+    return (
+        func.setweight(func.to_tsvector(TS_CONFIG, func.coalesce(University.name, EMPTY)), literal_column("'A'"))
+        .op("||")(
+            func.setweight(
+                func.to_tsvector(
+                    TS_CONFIG,
+                    func.coalesce(University.city, EMPTY).op("||")(SPACE).op("||")(func.coalesce(University.country, EMPTY)),
+                ),
+                literal_column("'B'"),
+            )
+        )
+        .op("||")(
+            func.setweight(func.to_tsvector(TS_CONFIG, func.coalesce(University.description, EMPTY)), literal_column("'C'"))
+        )
+    )
+
+
+def university_search_condition(search: str, dialect: str) -> ColumnElement:
+    """
+    Build the match condition for a free-text search.
+
+    On Postgres this is full-text search (websearch syntax) combined with
+    pg_trgm word similarity on each column for typo tolerance, all
+    served by GIN indexes. Other databases fall back to matching every word
+    with ILIKE.
+    """
+    if dialect == "postgresql":
+        term = literal(search)
+        return or_(
+            university_search_document().op("@@")(func.websearch_to_tsquery(TS_CONFIG, search)),
+            term.op("<%")(University.name),
+            term.op("<%")(University.city),
+            term.op("<%")(University.country),
+        )
+
+    words = search.split() or [search]
+    return and_(*[
+        or_(
+            University.name.ilike(f"%{word}%"),
+            University.city.ilike(f"%{word}%"),
+            University.country.ilike(f"%{word}%"),
+            University.description.ilike(f"%{word}%"),
+        )
+        for word in words
+    ])
+
+
+def university_search_rank(search: str, dialect: str) -> ColumnElement:
+    """Relevance score for a free-text search, higher is better"""
+    if dialect == "postgresql":
+        return (
+            func.ts_rank_cd(university_search_document(), func.websearch_to_tsquery(TS_CONFIG, search))
+            + func.word_similarity(literal(search), University.name)
+        )
+
+    return case(
+        (University.name.ilike(search), 3),
+        (University.name.ilike(f"{search}%"), 2),
+        (University.name.ilike(f"%{search}%"), 1),
+        else_=0,
+    )
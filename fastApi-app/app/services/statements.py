@@ -0,0 +1,39 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, TypeVar
+
+
+Statement = TypeVar("Statement")
+
+
+class StatementCache:
+    """
+    Bounded LRU cache of statements, one per statement shape.
+
+    SQLAlchemy caches the SQL compiled for a statement, but building the
+    statement and computing its cache key still cost Python time on every
+    request. A statement whose values are named bind parameters can be built
+    once and executed again with new `params`; the shape key must capture
+    everything else the statement's structure depends on.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._statements: "OrderedDict[Hashable, object]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def get(self, shape: Hashable, build: Callable[[], Statement]) -> Statement:
+        statement = self._statements.get(shape)
+        if statement is not None:
+            self._statements.move_to_end(shape)
+            return statement
+
+        statement = build()
+        self._statements[shape] = statement
+        while len(self._statements) > self.max_entries:
+            self._statements.popitem(last=False)
+        return statement
+
+    def clear(self) -> None:
+        self._statements.clear()
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import String, cast, column, func, literal_column, select, table, text, union_all
+from sqlalchemy.sql import CompoundSelect, Select
+
+from app.core.config import settings as Config
+from app.core.database import async_engine
+from app.models.university import University
+
+
+logger = logging.getLogger(__name__)
+
+STATISTICS_VIEW = "university_statistics"
+
+# Admin writes tend to come in bursts; refresh once after the burst
+REFRESH_DEBOUNCE_SECONDS = 5
+
+statistics_view = table(
+    STATISTICS_VIEW,
+    column("dimension"),
+    column("key"),
+    column("universities"),
+    column("with_scholarships"),
+    column("with_accommodation"),
+    column("partner_universities"),
+)
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def statistics_statement() -> CompoundSelect:
+    """
+    Aggregate active universities overall and by country, type and ranking.
+
+    Produces one row per (dimension, key) with the university count and the
+    feature counts, in a single UNION ALL round trip. The statistics
+    materialized view is defined by the same query.
+    """
+    def grouped(dimension: str, key):
+        statement = select(
+            # Inline literals so every branch of the UNION has a known text type
+            literal_column(f"'{dimension}'", String).label("dimension"),
+            key.label("key"),
+            func.count().label("universities"),
+            func.count().filter(University.offers_scholarships == True).label("with_scholarships"),
+            func.count().filter(University.provides_accommodation == True).label("with_accommodation"),
+            func.count().filter(University.partner_university == True).label("partner_universities"),
+        ).where(University.is_active == True)
+        return statement if dimension == "total" else statement.group_by(key)
+
+    return union_all(
+        grouped("total", literal_column("''", String)),
+        grouped("country", University.country),
+        grouped("type", cast(University.university_type, String)),
+        grouped("ranking", cast(University.ranking, String)),
+    )
+
+
+def statistics_view_statement() -> Select:
+    return select(statistics_view)
+
+
+async def refresh_statistics_view() -> None:
+    """Rebuild the statistics view without blocking readers"""
+    async with async_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {STATISTICS_VIEW}"))
+
+
+def statistics_view_enabled() -> bool:
+    return Config.STATISTICS_USE_MATERIALIZED_VIEW and async_engine.dialect.name == "postgresql"
+
+
+def schedule_statistics_refresh() -> None:
+    """Refresh the statistics view shortly after a write, coalescing bursts"""
+    global _refresh_task
+
+    if not statistics_view_enabled() or (_refresh_task is not None and not _refresh_task.done()):
+        return
+
+    async def refresh_later():
+        await asyncio.sleep(REFRESH_DEBOUNCE_SECONDS)
+        try:
+            await refresh_statistics_view()
+        except Exception as e:
+            logger.warning("Refreshing %s failed: %s", STATISTICS_VIEW, e)
+
+    _refresh_task = asyncio.create_task(refresh_later())
+
+
+async def refresh_statistics_periodically(interval: int) -> None:
+    """Keep the statistics view fresh on a schedule, until cancelled"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_statistics_view()
+        except Exception as e:
+            logger.warning("Refreshing %s failed: %s", STATISTICS_VIEW, e)
@@ -0,0 +1,166 @@
+import csv
+import json
+import uuid
+from datetime import datetime
+from typing import IO, Iterable, Iterator, List, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import response_cache
+from app.models.university import (
+    University,
+    AcademicProgram,
+    UniversityCreate,
+    UniversityImportError,
+    UniversityImportReport
+)
+from app.services.statistics import schedule_statistics_refresh
+from app.services.university_service import UNIVERSITY_LIST_TAG
+
+
+# A raw record is the parsed row, or the reason it could not be parsed
+RawRecord = Tuple[int, Union[dict, str]]
+
+# Cells holding JSON in CSV imports (and exports)
+CSV_JSON_COLUMNS = ("languages_of_instruction", "academic_programs")
+
+
+def read_jsonl(file: IO[str]) -> Iterator[RawRecord]:
+    """Yield (line number, record) for each non-blank line of a JSONL file"""
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Expected a JSON object"
+            continue
+        yield line_number, record
+
+
+def read_csv(file: IO[str]) -> Iterator[RawRecord]:
+    """
+    Yield (row number, record) for each row of a CSV file with a header row.
+
+    Empty cells are treated as missing; languages and programs are JSON cells,
+    as written by the export endpoint.
+    """
+    reader = csv.DictReader(file)
+    for row_number, row in enumerate(reader, start=1):
+        record = {name: value for name, value in row.items() if name and value not in ("", None)}
+        try:
+            for column in CSV_JSON_COLUMNS:
+                if column in record:
+                    record[column] = json.loads(record[column])
+        except ValueError as e:
+            yield row_number, f"Invalid JSON in column {column}: {e}"
+            continue
+        yield row_number, record
+
+
+class UniversityImportService:
+    async def import_universities(
+        self,
+        records: Iterable[RawRecord],
+        session: AsyncSession,
+        batch_size: int = 500
+    ) -> UniversityImportReport:
+        """
+        Bulk-load universities with nested programs.
+
+        Records are validated and written in batches of `batch_size`, each in
+        its own transaction using multi-row INSERTs for universities and
+        programs. Invalid rows are reported and skipped instead of failing the
+        whole load. If a batch is rejected by the database, it is retried row
+        by row so only the offending rows are lost.
+        """
+        report = UniversityImportReport()
+        batch: List[Tuple[int, UniversityCreate]] = []
+
+        for row, record in records:
+            report.received += 1
+            if isinstance(record, str):
+                self._reject(report, row, record)
+                continue
+
+            try:
+                batch.append((row, UniversityCreate.model_validate(record)))
+            except ValidationError as e:
+                self._reject(report, row, "; ".join(
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                    for error in e.errors()
+                ))
+                continue
+
+            if len(batch) >= batch_size:
+                await self._write_batch(batch, session, report)
+                batch = []
+
+        if batch:
+            await self._write_batch(batch, session, report)
+
+        if report.imported:
+            await response_cache.invalidate(UNIVERSITY_LIST_TAG)
+            schedule_statistics_refresh()
+
+        return report
+
+    def _reject(self, report: UniversityImportReport, row: int, error: str) -> None:
+        report.failed += 1
+        report.errors.append(UniversityImportError(row=row, error=error))
+
+    async def _write_batch(
+        self,
+        batch: List[Tuple[int, UniversityCreate]],
+        session: AsyncSession,
+        report: UniversityImportReport
+    ) -> None:
+        try:
+            await self._insert(session, [university for _, university in batch])
+            await session.commit()
+            report.imported += len(batch)
+            return
+        except Exception:
+            await session.rollback()
+
+        # Isolate the rows the database rejected
+        for row, university in batch:
+            try:
+                await self._insert(session, [university])
+                await session.commit()
+                report.imported += 1
+            except Exception as e:
+                await session.rollback()
+                self._reject(report, row, f"Database error: {e}")
+
+    async def _insert(self, session: AsyncSession, universities: List[UniversityCreate]) -> None:
+        now = datetime.now()
+        university_rows, program_rows = [], []
+
+        for university in universities:
+            # Keys are generated here so programs can reference their university
+            # without a round trip per row
+            university_uid = uuid.uuid4()
+            university_rows.append({
+                **university.model_dump(exclude={"academic_programs"}),
+                "uid": university_uid,
+                "created_at": now,
+                "updated_at": now,
+            })
+            for program in university.academic_programs:
+                program_rows.append({
+                    **program.model_dump(),
+                    "uid": uuid.uuid4(),
+                    "university_uid": university_uid,
+                    "created_at": now,
+                    "updated_at": now,
+                })
+
+        await session.exec(insert(University.__table__), params=university_rows)
+        if program_rows:
+            await session.exec(insert(AcademicProgram.__table__), params=program_rows)
@@ -1,7 +1,11 @@
 import uuid
+import json
 import asyncio
-from typing import List, Optional
-from sqlmodel import select, and_
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlmodel import select, and_, func
+import sqlalchemy.dialects.postgresql as pg
+from sqlalchemy import Integer, Row, String, bindparam, case, cast, literal_column, tuple_, union_all, update
+from sqlalchemy.orm import selectinload
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import InterfaceError
 from fastapi import HTTPException, status
@@ -12,9 +16,118 @@ from app.models.university import (
     AcademicProgram,
     UniversityCreate, 
     UniversityUpdate,
+    UniversityListResponse,
+    AcademicProgramResponse,
+    UniversityFilter,
+    UniversityBulkUpdate,
+    UniversityBulkUpdateResult,
+    UniversityBulkStatus,
+    UniversityFacets,
+    FacetCount,
     UniversityType,
-    Ranking
+    Ranking,
+    Language,
+    UniversitySort,
+    university_ranking_order
 )
+from app.core.cache import response_cache
+from app.services.pagination import encode_cursor, decode_cursor
+from app.services.search import university_search_condition, university_search_rank
+from app.services.statements import StatementCache
+from app.services.statistics import (
+    statistics_statement,
+    statistics_view_statement,
+    statistics_view_enabled,
+    schedule_statistics_refresh
+)
+
+
+# Columns needed to build a UniversityListResponse, in field order
+UNIVERSITY_LIST_COLUMNS = tuple(
+    getattr(University, field) for field in UniversityListResponse.model_fields
+)
+
+
+# Cache tags: every list page depends on the whole table, while detail and
+# program responses depend on a single university
+UNIVERSITY_LIST_TAG = "universities"
+
+
+def university_tag(university_id: uuid.UUID) -> str:
+    return f"university:{university_id}"
+
+
+# Facet name -> grouping expression, as text so every branch of the UNION agrees
+FACET_KEYS = {
+    "country": University.country,
+    "university_type": cast(University.university_type, String),
+    "ranking": cast(University.ranking, String),
+    "offers_scholarships": case(
+        (University.offers_scholarships == True, literal_column("'true'")), else_=literal_column("'false'")
+    ),
+    "provides_accommodation": case(
+        (University.provides_accommodation == True, literal_column("'true'")), else_=literal_column("'false'")
+    ),
+}
+
+
+# Columns needed to build a ProgramSearchResult
+PROGRAM_SEARCH_COLUMNS = (
+    *(getattr(AcademicProgram, field) for field in AcademicProgramResponse.model_fields),
+    University.name.label("university_name"),
+    University.country.label("university_country"),
+    University.city.label("university_city"),
+)
+
+
+# Sort -> (key, type of the key in a cursor, nullable). Every key is
+# backed by a partial index on (key, uid); see the University model.
+SORT_KEYS = {
+    "name": (University.name, str, False),
+    "ranking": (university_ranking_order, int, False),
+    "tuition": (University.average_annual_tuition, float, True),
+    "acceptance_rate": (University.acceptance_rate, float, True),
+    "founded_year": (University.founded_year, int, True),
+    "nigerian_students": (University.nigerian_students, int, True),
+}
+
+
+# List filters compared with a named bind parameter, so that a statement built
+# for one set of filters can be executed again with other values: filter -> condition.
+# Boolean filters are rendered as literals instead, which lets the planner match
+# the partial indexes on is_active.
+BOUND_FILTERS = {
+    "country": lambda value: University.country.ilike(value),
+    "city": lambda value: University.city.ilike(value),
+    "university_type": lambda value: University.university_type == value,
+    "ranking": lambda value: University.ranking == value,
+    "min_tuition": lambda value: University.average_annual_tuition >= value,
+    "max_tuition": lambda value: University.average_annual_tuition <= value,
+    "min_acceptance_rate": lambda value: University.acceptance_rate >= value,
+    "max_acceptance_rate": lambda value: University.acceptance_rate <= value,
+    "min_founded_year": lambda value: University.founded_year >= value,
+    "max_founded_year": lambda value: University.founded_year <= value,
+    "min_nigerian_students": lambda value: University.nigerian_students >= value,
+    "max_nigerian_students": lambda value: University.nigerian_students <= value,
+}
+
+# Filters matched as a substring
+PATTERN_FILTERS = {"country", "city"}
+
+# Statements by shape for the list and detail queries; see StatementCache
+list_statements = StatementCache()
+
+UNIVERSITY_BY_ID = (
+    select(University)
+    .options(selectinload(University.academic_programs))
+    .where(University.uid == bindparam("university_id"))
+    .execution_options(query_name="universities.detail")
+)
+
+
+def get_dialect(session: AsyncSession) -> str:
+    """Name of the database dialect behind a session, e.g. 'postgresql' or 'sqlite'"""
+    return session.get_bind().dialect.name
 
 
 class UniversityService:
@@ -38,7 +151,10 @@ class UniversityService:
                     session.add(program)
             
             await session.commit()
-            await session.refresh(university)
+            # Load the new programs for the response; columns are still loaded
+            await session.refresh(university, ["academic_programs"])
+            await response_cache.invalidate(UNIVERSITY_LIST_TAG)
+            schedule_statistics_refresh()
             return university
             
         except Exception as e:
@@ -51,14 +167,7 @@ class UniversityService:
     async def get_university_by_id(self, university_id: uuid.UUID, session: AsyncSession) -> Optional[University]:
         """Get university by ID with academic programs"""
         try:
-            from sqlalchemy.orm import selectinload
-            
-            statement = (
-                select(University)
-                .options(selectinload(University.academic_programs))
-                .where(University.uid == university_id)
-            )
-            result = await session.exec(statement)
+            result = await session.exec(UNIVERSITY_BY_ID, params={"university_id": university_id})
             university = result.first()
             
             if not university:
@@ -77,6 +186,133 @@ class UniversityService:
                 )
             raise
 
+    def _apply_filters(
+        self,
+        statement,
+        dialect: str,
+        offers_scholarships: Optional[bool] = None,
+        provides_accommodation: Optional[bool] = None,
+        search: Optional[str] = None,
+        is_active: bool = True,
+        **filters
+    ):
+        """
+        Apply the public list filters to a University statement.
+
+        Besides the arguments above, any of BOUND_FILTERS can be given, e.g.
+        country or min_tuition.
+        """
+        unknown = filters.keys() - BOUND_FILTERS.keys()
+        if unknown:
+            raise TypeError(f"Unknown university filters: {', '.join(sorted(unknown))}")
+
+        statement = statement.where(University.is_active == is_active)
+
+        for name, value in self._filter_params(filters).items():
+            statement = statement.where(BOUND_FILTERS[name](bindparam(f"filter_{name}", value)))
+
+        if offers_scholarships is not None:
+            statement = statement.where(University.offers_scholarships == offers_scholarships)
+            
+        if provides_accommodation is not None:
+            statement = statement.where(University.provides_accommodation == provides_accommodation)
+            
+        if search:
+            statement = statement.where(university_search_condition(search, dialect))
+
+        return statement
+
+    def _filter_params(self, filters: dict) -> dict:
+        """Values of the bound filters that are set, as compared in SQL"""
+        return {
+            name: f"%{value}%" if name in PATTERN_FILTERS else value
+            for name, value in filters.items()
+            if name in BOUND_FILTERS and value is not None and value != ""
+        }
+
+    def _bind_filters(self, filters: dict) -> dict:
+        """Execution parameters for the bound filters of a statement built by _apply_filters"""
+        return {f"filter_{name}": value for name, value in self._filter_params(filters).items()}
+
+    def _statement_shape(self, *parts, **filters) -> Optional[tuple]:
+        """
+        Cache key for a list statement: which bound filters are set and the
+        value of every other argument. Searches are not cached, as their
+        conditions embed the search text.
+        """
+        if filters.get("search"):
+            return None
+
+        return parts + tuple(sorted(
+            (name, None if name in BOUND_FILTERS else getattr(value, "value", value))
+            for name, value in filters.items()
+            if value is not None and value != ""
+        ))
+
+    def _offset_statement(
+        self,
+        statement,
+        dialect: str,
+        skip: int,
+        limit: int,
+        search: Optional[str] = None,
+        sort: Optional[UniversitySort] = None,
+        part: Optional[str] = None,
+        **filters
+    ):
+        """
+        Filter, order and offset-paginate a University statement.
+
+        For a nullable sort key, `part` selects the universities with a value
+        ("values", ordered by key and uid) or those without ("nulls", ordered
+        by uid); see _split_by_sort_value.
+        """
+        statement = self._apply_filters(statement, dialect, search=search, **filters)
+        
+        if search and sort is None:
+            # Best matches first when searching
+            statement = statement.order_by(
+                university_search_rank(search, dialect).desc(),
+                University.uid
+            )
+        else:
+            key, _, _, descending = self._sort_key(sort)
+            if part == "nulls":
+                statement = statement.where(key.is_(None)).order_by(
+                    University.uid.desc() if descending else University.uid
+                )
+            else:
+                if part == "values":
+                    statement = statement.where(key.isnot(None))
+                statement = self._order_by_key(statement, key, descending)
+        
+        return statement.offset(bindparam("skip", skip, type_=Integer)).limit(bindparam("limit", limit, type_=Integer))
+
+    def _sort_key(self, sort: Optional[UniversitySort]):
+        """Key expression, cursor type, nullability and direction of a list sort (name by default)"""
+        name = UniversitySort(sort or UniversitySort.NAME).value
+        key, key_type, nullable = SORT_KEYS[name.lstrip("-")]
+        return key, key_type, nullable, name.startswith("-")
+
+    def _split_by_sort_value(self, sort: Optional[UniversitySort], search: Optional[str]) -> bool:
+        """
+        Whether a list sorted this way is read in two parts: the universities
+        with a value for the sort key, then those without.
+
+        Each part is a plain range of the (key, uid) index in either direction,
+        where a single ORDER BY key NULLS LAST could only be served by a sort
+        (descending) or an index per direction.
+        """
+        if search and sort is None:
+            return False
+        return self._sort_key(sort)[2]
+
+    def _order_by_key(self, statement, key, descending: bool):
+        """Order by (key, uid) in one direction so an index on (key, uid) can serve it"""
+        if descending:
+            return statement.order_by(key.desc(), University.uid.desc())
+        return statement.order_by(key, University.uid)
+
     async def get_universities(
         self, 
         session: AsyncSession,
@@ -90,44 +326,23 @@ class UniversityService:
         provides_accommodation: Optional[bool] = None,
         search: Optional[str] = None
     ) -> List[University]:
-        """Get universities with filtering options"""
+        """Get universities with filtering options, including their academic programs"""
         
         try:
-            from sqlalchemy.orm import selectinload
-            
-            statement = (
-                select(University)
-                .options(selectinload(University.academic_programs))
-                .where(University.is_active == True)
+            statement = self._offset_statement(
+                select(University).options(selectinload(University.academic_programs)),
+                get_dialect(session),
+                skip,
+                limit,
+                country=country,
+                city=city,
+                university_type=university_type,
+                ranking=ranking,
+                offers_scholarships=offers_scholarships,
+                provides_accommodation=provides_accommodation,
+                search=search
             )
             
-            # Apply filters
-            if country:
-                statement = statement.where(University.country.ilike(f"%{country}%"))
-            
-            if city:
-                statement = statement.where(University.city.ilike(f"%{city}%"))
-                
-            if university_type:
-                statement = statement.where(University.university_type == university_type)
-                
-            if ranking:
-                statement = statement.where(University.ranking == ranking)
-                
-            if offers_scholarships is not None:
-                statement = statement.where(University.offers_scholarships == offers_scholarships)
-                
-            if provides_accommodation is not None:
-                statement = statement.where(University.provides_accommodation == provides_accommodation)
-                
-            if search:
-                statement = statement.where(
-                    University.name.ilike(f"%{search}%")
-                )
-            
-            # Apply pagination
-            statement = statement.offset(skip).limit(limit)
-            
             result = await session.exec(statement)
             universities = result.all()
             return universities
@@ -140,6 +355,329 @@ class UniversityService:
                 )
             raise
 
+    async def get_university_summaries(
+        self,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        **filters
+    ) -> List[Row]:
+        """
+        Get universities with filtering options as lightweight rows.
+
+        Only the columns of UniversityListResponse are selected, so no University
+        instances or academic programs are loaded.
+        """
+        dialect = get_dialect(session)
+
+        def statement_for(part: Optional[str]):
+            def build():
+                return self._offset_statement(
+                    select(*UNIVERSITY_LIST_COLUMNS), dialect, skip, limit, part=part, **filters
+                ).execution_options(query_name="universities.list")
+
+            shape = self._statement_shape("summaries", dialect, part, **filters)
+            return build() if shape is None else list_statements.get(shape, build)
+
+        params = self._bind_filters(filters)
+
+        try:
+            if not self._split_by_sort_value(filters.get("sort"), filters.get("search")):
+                result = await session.exec(statement_for(None), params={**params, "skip": skip, "limit": limit})
+                return result.all()
+
+            result = await session.exec(statement_for("values"), params={**params, "skip": skip, "limit": limit})
+            universities = result.all()
+            if len(universities) == limit:
+                return universities
+
+            # The universities with a value ran out before or on this page. Unless it
+            # shows some of them, skipping into the rest needs to know how many there are.
+            nulls_skip = 0
+            if not universities and skip > 0:
+                nulls_skip = max(skip - await self._count_sort_values(session, dialect, **filters), 0)
+            result = await session.exec(
+                statement_for("nulls"), params={**params, "skip": nulls_skip, "limit": limit - len(universities)}
+            )
+            return universities + result.all()
+
+        except InterfaceError as e:
+            if "connection is closed" in str(e):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Database connection error. Please try again."
+                )
+            raise
+
+    async def _count_sort_values(
+        self, session: AsyncSession, dialect: str, sort: Optional[UniversitySort] = None, **filters
+    ) -> int:
+        """Number of universities matching the filters that have a value for the sort key"""
+        key = self._sort_key(sort)[0]
+
+        def build():
+            return self._apply_filters(
+                select(func.count()).select_from(University), dialect, **filters
+            ).where(key.isnot(None)).execution_options(query_name="universities.count")
+
+        shape = self._statement_shape("sort_values", dialect, UniversitySort(sort).value, **filters)
+        statement = build() if shape is None else list_statements.get(shape, build)
+        result = await session.exec(statement, params=self._bind_filters(filters))
+        return result.one()
+
+    async def get_universities_page(
+        self,
+        session: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        sort: Optional[UniversitySort] = None,
+        **filters
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        Get a page of university summary rows using keyset pagination on (sort key, uid).
+
+        Returns the page and the cursor for the next one (None on the last page).
+        Unlike offset pagination, the cost of a page does not grow with its depth.
+
+        For a nullable sort key the universities with a value are paged first
+        and those without one after them, ordered by uid; each part is a plain
+        range of the (key, uid) index. A cursor with no key value points into
+        the second part.
+        """
+        dialect = get_dialect(session)
+        key, key_type, nullable, descending = self._sort_key(sort)
+        params = self._bind_filters(filters)
+        sort_name = UniversitySort(sort or UniversitySort.NAME).value
+
+        after_key = after_null = False
+        if cursor:
+            value, uid = decode_cursor(cursor, 2)
+            try:
+                params["cursor_uid"] = uuid.UUID(uid)
+                if value is None and nullable:
+                    after_null = True
+                else:
+                    params["cursor_key"] = key_type(value)
+                    after_key = True
+            except (TypeError, ValueError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor"
+                )
+
+        def build_values():
+            statement = self._apply_filters(
+                select(*UNIVERSITY_LIST_COLUMNS, key.label("sort_key")),
+                dialect,
+                **filters
+            )
+            if nullable:
+                statement = statement.where(key.isnot(None))
+
+            if after_key:
+                position = tuple_(key, University.uid)
+                after = tuple_(
+                    bindparam("cursor_key", type_=key.type),
+                    bindparam("cursor_uid", type_=University.uid.type),
+                )
+                statement = statement.where(position < after if descending else position > after)
+
+            statement = self._order_by_key(statement, key, descending)
+            return statement.limit(bindparam("limit", type_=Integer)).execution_options(query_name="universities.page")
+
+        def build_nulls():
+            statement = self._apply_filters(
+                select(*UNIVERSITY_LIST_COLUMNS, key.label("sort_key")),
+                dialect,
+                **filters
+            ).where(key.is_(None))
+
+            if after_null:
+                after = bindparam("cursor_uid", type_=University.uid.type)
+                statement = statement.where(University.uid < after if descending else University.uid > after)
+
+            statement = statement.order_by(University.uid.desc() if descending else University.uid)
+            return statement.limit(bindparam("limit", type_=Integer)).execution_options(query_name="universities.page")
+
+        def statement_for(part: str, after_cursor: bool, build):
+            shape = self._statement_shape("page", dialect, sort_name, part, after_cursor, **filters)
+            return build() if shape is None else list_statements.get(shape, build)
+
+        try:
+            # Fetch one extra row to know whether another page exists
+            universities = []
+            if not after_null:
+                result = await session.exec(statement_for("values", after_key, build_values), params={**params, "limit": limit + 1})
+                universities = result.all()
+
+            if nullable and len(universities) <= limit:
+                result = await session.exec(
+                    statement_for("nulls", after_null, build_nulls), params={**params, "limit": limit + 1 - len(universities)}
+                )
+                universities += result.all()
+
+            next_cursor = None
+            if len(universities) > limit:
+                universities = universities[:limit]
+                last = universities[-1]
+                next_cursor = encode_cursor([last.sort_key, last.uid])
+
+            return universities, next_cursor
+
+        except InterfaceError as e:
+            if "connection is closed" in str(e):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Database connection error. Please try again."
+                )
+            raise
+
+    async def count_universities(
+        self,
+        session: AsyncSession,
+        mode: str = "exact",
+        cap: int = 1000,
+        **filters
+    ) -> str:
+        """
+        Count the universities matching the list filters, as a header value.
+
+        Modes:
+        - exact: COUNT(*) over every match.
+        - estimated: the planner's row estimate on Postgres, so nothing is
+          scanned; other databases count exactly.
+        - capped: count at most `cap` matches, reporting e.g. "1000+" beyond that.
+        """
+        dialect = get_dialect(session)
+        matches = self._apply_filters(select(University.uid), dialect, **filters)
+
+        try:
+            if mode == "estimated" and dialect == "postgresql":
+                # Binds are inlined because EXPLAIN cannot be prepared with parameters
+                compiled = matches.compile(
+                    dialect=session.get_bind().dialect,
+                    compile_kwargs={"literal_binds": True}
+                )
+                conn = await session.connection()
+                result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+                plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return str(int(plan[0]["Plan"]["Plan Rows"]))
+
+            if mode == "capped":
+                matches = matches.limit(cap + 1)
+
+            result = await session.exec(
+                select(func.count())
+                .select_from(matches.subquery())
+                .execution_options(query_name="universities.count")
+            )
+            total = result.one()
+
+        except InterfaceError as e:
+            if "connection is closed" in str(e):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Database connection error. Please try again."
+                )
+            raise
+
+        if mode == "capped" and total > cap:
+            return f"{cap}+"
+        return str(total)
+
+    async def get_university_facets(self, session: AsyncSession, **filters) -> UniversityFacets:
+        """
+        Count matching universities per option of each filter, in one query.
+
+        Each facet is counted under every active filter except its own, so the
+        counts say how many results picking that option would give. The
+        facets are GROUP BY branches of a single UNION ALL, since each needs
+        its own WHERE clause.
+        """
+        dialect = get_dialect(session)
+
+        def facet(name: str, key):
+            own_filters = {field: value for field, value in filters.items() if field != name}
+            return self._apply_filters(
+                select(
+                    literal_column(f"'{name}'", String).label("facet"),
+                    key.label("value"),
+                    func.count().label("count"),
+                ),
+                dialect,
+                **own_filters
+            )
+
+        statement = union_all(
+            facet("total", literal_column("''", String)),
+            *[facet(name, key).group_by(key) for name, key in FACET_KEYS.items()]
+        ).execution_options(query_name="universities.facets")
+
+        try:
+            result = await session.exec(statement)
+        except InterfaceError as e:
+            if "connection is closed" in str(e):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Database connection error. Please try again."
+                )
+            raise
+
+        facets = UniversityFacets()
+        for row in result:
+            if row.facet == "total":
+                facets.total = row.count
+                continue
+
+            value = row.value
+            # Enums are stored by member name
+            if row.facet == "university_type":
+                value = UniversityType[value].value
+            elif row.facet == "ranking":
+                value = Ranking[value].value
+            getattr(facets, row.facet).append(FacetCount(value=value, count=row.count))
+
+        for name in FACET_KEYS:
+            getattr(facets, name).sort(key=lambda facet_count: (-facet_count.count, facet_count.value))
+
+        return facets
+
+    async def get_catalogue_version(self, session: AsyncSession) -> Optional[datetime]:
+        """
+        Cheap change probe for list responses: the latest updated_at, read from
+        the end of its index.
+
+        Deletes are soft and every write stamps updated_at, so any change to
+        the table moves it.
+        """
+        statement = (
+            select(func.max(University.updated_at))
+            .execution_options(query_name="universities.catalogue_version")
+        )
+        result = await session.exec(statement)
+        return result.one()
+
+    async def get_university_version(self, university_id: uuid.UUID, session: AsyncSession) -> Optional[Row]:
+        """
+        Cheap change probe for one university and its programs:
+        (updated_at, program count, latest program updated_at), or None if it does not exist.
+        """
+        statement = (
+            select(
+                University.updated_at,
+                func.count(AcademicProgram.uid),
+                func.max(AcademicProgram.updated_at)
+            )
+            .outerjoin(AcademicProgram, AcademicProgram.university_uid == University.uid)
+            .where(University.uid == university_id)
+            .group_by(University.uid, University.updated_at)
+            .execution_options(query_name="universities.version")
+        )
+        result = await session.exec(statement)
+        return result.first()
+
     async def update_university(
         self, 
         university_id: uuid.UUID, 
@@ -168,34 +706,139 @@ class UniversityService:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Error updating university: {str(e)}"
                 )
+
+            await response_cache.invalidate(university_tag(university_id), UNIVERSITY_LIST_TAG)
+            schedule_statistics_refresh()
         
         return university
 
-    async def delete_university(self, university_id: uuid.UUID, session: AsyncSession) -> bool:
-        """Soft delete university (mark as inactive)"""
-        university = await self.get_university_by_id(university_id, session)
-        
+    def _filter_criteria(self, university_filter: Optional[UniversityFilter]) -> dict:
+        """Criteria of a bulk filter, refusing one that would match every university"""
+        criteria = university_filter.model_dump(exclude_none=True) if university_filter else {}
+        if not criteria:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Filter must specify at least one criterion"
+            )
+        return criteria
+
+    async def bulk_update_universities(
+        self,
+        bulk_data: UniversityBulkUpdate,
+        session: AsyncSession
+    ) -> UniversityBulkUpdateResult:
+        """
+        Apply partial updates to many universities in one transaction.
+
+        Takes either a list of per-university updates or a filter plus one set
+        of fields. Per-university updates are grouped by identical field
+        values, so setting the same value across many universities is a single
+        UPDATE ... RETURNING statement rather than one load and save each.
+        """
+        now = datetime.now()
+        statements = []
+        requested: List[uuid.UUID] = []
+
+        if bulk_data.updates is not None and bulk_data.filter is None and bulk_data.fields is None:
+            uids = [item.uid for item in bulk_data.updates]
+            if len(set(uids)) != len(uids):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Each university may only appear once per bulk update"
+                )
+
+            groups = {}
+            for item in bulk_data.updates:
+                fields = item.fields.model_dump(exclude_unset=True)
+                if not fields:
+                    continue
+                key = json.dumps(fields, sort_keys=True, default=str)
+                groups.setdefault(key, (fields, []))[1].append(item.uid)
+                requested.append(item.uid)
+
+            for fields, group_uids in groups.values():
+                statements.append(
+                    update(University)
+                    .where(University.uid.in_(group_uids))
+                    .values(**fields, updated_at=now)
+                )
+        elif bulk_data.updates is None and bulk_data.fields is not None:
+            criteria = self._filter_criteria(bulk_data.filter)
+            fields = bulk_data.fields.model_dump(exclude_unset=True)
+            if fields:
+                statements.append(
+                    self._apply_filters(update(University), get_dialect(session), **criteria)
+                    .values(**fields, updated_at=now)
+                )
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide either 'updates', or 'filter' together with 'fields'"
+            )
+
+        if not statements:
+            return UniversityBulkUpdateResult()
+
         try:
-            # Soft delete by marking as inactive
-            university.is_active = False
-            university.updated_at = datetime.now()
-            
-            # Also deactivate all academic programs
-            statement = select(AcademicProgram).where(
-                AcademicProgram.university_uid == university_id
+            updated: List[uuid.UUID] = []
+            for statement in statements:
+                result = await session.exec(
+                    statement.returning(University.uid),
+                    execution_options={"synchronize_session": False}
+                )
+                updated.extend(result.scalars().all())
+
+            tags = [university_tag(uid) for uid in updated]
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Error updating universities: {str(e)}"
             )
-            result = await session.exec(statement)
-            programs = result.all()
-            
-            for program in programs:
-                program.is_active = False
-                program.updated_at = datetime.now()
-                session.add(program)
-            
-            session.add(university)
+
+        if updated:
+            await response_cache.invalidate(*tags, UNIVERSITY_LIST_TAG)
+            schedule_statistics_refresh()
+
+        found = set(updated)
+        return UniversityBulkUpdateResult(
+            updated=len(updated),
+            uids=updated,
+            not_found=[uid for uid in requested if uid not in found]
+        )
+
+    async def _set_active(self, condition, active: bool, session: AsyncSession) -> List[uuid.UUID]:
+        """
+        Mark the universities matching `condition`, and all their programs,
+        active or inactive with two set-based UPDATEs. Returns the uids changed;
+        the caller owns the transaction.
+        """
+        now = datetime.now()
+        result = await session.exec(
+            update(University)
+            .where(condition)
+            .values(is_active=active, updated_at=now)
+            .returning(University.uid),
+            execution_options={"synchronize_session": False}
+        )
+        uids = list(result.scalars().all())
+
+        if uids:
+            await session.exec(
+                update(AcademicProgram)
+                .where(AcademicProgram.university_uid.in_(uids))
+                .values(is_active=active, updated_at=now),
+                execution_options={"synchronize_session": False}
+            )
+
+        return uids
+
+    async def delete_university(self, university_id: uuid.UUID, session: AsyncSession) -> bool:
+        """Soft delete university (mark it and its programs as inactive)"""
+        try:
+            deleted = await self._set_active(University.uid == university_id, False, session)
             await session.commit()
-            return True
-            
         except Exception as e:
             await session.rollback()
             raise HTTPException(
@@ -203,15 +846,128 @@ class UniversityService:
                 detail=f"Error deleting university: {str(e)}"
             )
 
+        if not deleted:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="University not found"
+            )
+
+        await response_cache.invalidate(university_tag(university_id), UNIVERSITY_LIST_TAG)
+        schedule_statistics_refresh()
+        return True
+
+    async def set_universities_active(
+        self,
+        bulk_data: UniversityBulkStatus,
+        active: bool,
+        session: AsyncSession
+    ) -> UniversityBulkUpdateResult:
+        """
+        Deactivate or reactivate many universities, with their programs, in one transaction.
+
+        Universities are selected by uid, or by a filter that matches those
+        currently in the opposite state. Reactivation also reactivates every
+        program of the university.
+        """
+        if bulk_data.uids is not None and bulk_data.filter is None:
+            condition = University.uid.in_(bulk_data.uids)
+        elif bulk_data.uids is None and bulk_data.filter is not None:
+            criteria = self._filter_criteria(bulk_data.filter)
+            condition = self._apply_filters(
+                select(University.uid), get_dialect(session), is_active=not active, **criteria
+            ).whereclause
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide either 'uids' or 'filter'"
+            )
+
+        try:
+            changed = await self._set_active(condition, active, session)
+            tags = [university_tag(uid) for uid in changed]
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Error updating universities: {str(e)}"
+            )
+
+        if changed:
+            await response_cache.invalidate(*tags, UNIVERSITY_LIST_TAG)
+            schedule_statistics_refresh()
+
+        found = set(changed)
+        return UniversityBulkUpdateResult(
+            updated=len(changed),
+            uids=changed,
+            not_found=[uid for uid in bulk_data.uids or [] if uid not in found]
+        )
+
+    async def stream_universities(
+        self,
+        session: AsyncSession,
+        include_programs: bool = False,
+        include_inactive: bool = False,
+        batch_size: int = 500
+    ) -> AsyncIterator[dict]:
+        """
+        Stream the catalogue as plain dicts, one university at a time.
+
+        Rows come from a server-side cursor in batches of `batch_size`, so memory
+        use does not depend on the size of the catalogue. With `include_programs`
+        each university carries its programs under "academic_programs", read in
+        the same pass through an outer join ordered by university.
+        """
+        universities = University.__table__
+        programs = AcademicProgram.__table__
+        program_columns = [column.label(f"program_{column.name}") for column in programs.columns]
+
+        if include_programs:
+            join_condition = programs.c.university_uid == universities.c.uid
+            if not include_inactive:
+                join_condition = and_(join_condition, programs.c.is_active == True)
+            statement = (
+                select(universities, *program_columns)
+                .select_from(universities.outerjoin(programs, join_condition))
+            )
+        else:
+            statement = select(universities)
+
+        if not include_inactive:
+            statement = statement.where(universities.c.is_active == True)
+        statement = statement.order_by(universities.c.uid).execution_options(yield_per=batch_size)
+
+        result = await session.stream(statement)
+        current = None
+        async for row in result:
+            values = row._mapping
+            if current is None or current["uid"] != values["uid"]:
+                if current is not None:
+                    yield current
+                current = {column.name: values[column.name] for column in universities.columns}
+                if include_programs:
+                    current["academic_programs"] = []
+
+            if include_programs and values["program_uid"] is not None:
+                current["academic_programs"].append(
+                    {column.name: values[f"program_{column.name}"] for column in programs.columns}
+                )
+
+        if current is not None:
+            yield current
+
     async def get_university_statistics(self, session: AsyncSession):
-        """Get university statistics"""
+        """Get university statistics, aggregated in the database"""
         try:
-            statement = select(University).where(University.is_active == True)
+            if statistics_view_enabled():
+                statement = statistics_view_statement()
+            else:
+                statement = statistics_statement()
             result = await session.exec(statement)
-            total_universities = result.all()
             
             stats = {
-                "total_universities": len(total_universities),
+                "total_universities": 0,
                 "by_country": {},
                 "by_type": {},
                 "by_ranking": {},
@@ -220,23 +976,19 @@ class UniversityService:
                 "partner_universities": 0
             }
             
-            for uni in total_universities:
-                # Count by country
-                stats["by_country"][uni.country] = stats["by_country"].get(uni.country, 0) + 1
-                
-                # Count by type
-                stats["by_type"][uni.university_type.value] = stats["by_type"].get(uni.university_type.value, 0) + 1
-                
-                # Count by ranking
-                stats["by_ranking"][uni.ranking.value] = stats["by_ranking"].get(uni.ranking.value, 0) + 1
-                
-                # Count features
-                if uni.offers_scholarships:
-                    stats["with_scholarships"] += 1
-                if uni.provides_accommodation:
-                    stats["with_accommodation"] += 1
-                if uni.partner_university:
-                    stats["partner_universities"] += 1
+            for row in result:
+                if row.dimension == "total":
+                    stats["total_universities"] = row.universities
+                    stats["with_scholarships"] = row.with_scholarships
+                    stats["with_accommodation"] = row.with_accommodation
+                    stats["partner_universities"] = row.partner_universities
+                elif row.dimension == "country":
+                    stats["by_country"][row.key] = row.universities
+                elif row.dimension == "type":
+                    # Enums are stored by member name
+                    stats["by_type"][UniversityType[row.key].value] = row.universities
+                elif row.dimension == "ranking":
+                    stats["by_ranking"][Ranking[row.key].value] = row.universities
             
             return stats
             
@@ -259,6 +1011,7 @@ class AcademicProgramService:
                         AcademicProgram.is_active == True
                     )
                 )
+                .execution_options(query_name="universities.programs")
             )
             result = await session.exec(statement)
             return result.all()
@@ -296,3 +1049,110 @@ class AcademicProgramService:
                     detail="Database connection error. Please try again."
                 )
             raise
+
+    async def search_programs(
+        self,
+        session: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        name: Optional[str] = None,
+        degree_type: Optional[str] = None,
+        faculty: Optional[str] = None,
+        department: Optional[str] = None,
+        min_tuition: Optional[float] = None,
+        max_tuition: Optional[float] = None,
+        min_duration: Optional[float] = None,
+        max_duration: Optional[float] = None,
+        country: Optional[str] = None,
+        language: Optional[Language] = None
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        Search active programs of active universities, keyset-paginated on (name, uid).
+
+        Degree type, faculty and department are matched exactly so the
+        partial indexes on academic_programs apply. Returns the page of rows
+        and the cursor for the next one (None on the last page).
+        """
+        try:
+            statement = (
+                select(*PROGRAM_SEARCH_COLUMNS)
+                .join(University, University.uid == AcademicProgram.university_uid)
+                .where(AcademicProgram.is_active == True, University.is_active == True)
+            )
+
+            if name:
+                statement = statement.where(AcademicProgram.name.ilike(f"%{name}%"))
+
+            if degree_type:
+                statement = statement.where(AcademicProgram.degree_type == degree_type)
+
+            if faculty:
+                statement = statement.where(AcademicProgram.faculty == faculty)
+
+            if department:
+                statement = statement.where(AcademicProgram.department == department)
+
+            if min_tuition is not None:
+                statement = statement.where(AcademicProgram.tuition_fee >= min_tuition)
+
+            if max_tuition is not None:
+                statement = statement.where(AcademicProgram.tuition_fee <= max_tuition)
+
+            if min_duration is not None:
+                statement = statement.where(AcademicProgram.duration_years >= min_duration)
+
+            if max_duration is not None:
+                statement = statement.where(AcademicProgram.duration_years <= max_duration)
+
+            if country:
+                statement = statement.where(University.country.ilike(f"%{country}%"))
+
+            if language:
+                if get_dialect(session) == "postgresql":
+                    statement = statement.where(
+                        cast(University.languages_of_instruction, pg.JSONB).contains([language.value])
+                    )
+                else:
+                    # Languages are stored as a JSON array of quoted names
+                    statement = statement.where(
+                        cast(University.languages_of_instruction, String).like(f'%"{language.value}"%')
+                    )
+
+            if cursor:
+                program_name, uid = decode_cursor(cursor, 2)
+                try:
+                    if not isinstance(program_name, str):
+                        raise TypeError("cursor name must be a string")
+                    uid = uuid.UUID(uid)
+                except (TypeError, ValueError):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Invalid pagination cursor"
+                    )
+                statement = statement.where(tuple_(AcademicProgram.name, AcademicProgram.uid) > (program_name, uid))
+
+            # Fetch one extra row to know whether another page exists
+            statement = (
+                statement.order_by(AcademicProgram.name, AcademicProgram.uid)
+                .limit(limit + 1)
+                .execution_options(query_name="programs.search")
+            )
+
+            result = await session.exec(statement)
+            programs = result.all()
+
+            next_cursor = None
+            if len(programs) > limit:
+                programs = programs[:limit]
+                last = programs[-1]
+                next_cursor = encode_cursor([last.name, last.uid])
+
+            return programs, next_cursor
+
+        except InterfaceError as e:
+            if "connection is closed" in str(e):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Database connection error. Please try again."
+                )
+            raise
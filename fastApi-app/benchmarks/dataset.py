@@ -0,0 +1,240 @@
+"""
+Generate a synthetic catalogue of the size of production, or bigger.
+
+Creates N universities with M programs each and K verified users. Countries,
+university types and rankings follow a Zipf-like distribution: with skew 0
+every option is equally likely, and the higher the skew, the more the first
+options dominate, as Nigeria and private universities do in the real data.
+Apart from timestamps, the rows are reproducible for a given seed. They are
+bulk-inserted in batches.
+
+Every user has the password BENCHMARK_PASSWORD; users[0] is an admin.
+
+Usage (from the fastApi-app directory):
+    python -m benchmarks.dataset --universities 20000 --programs 12 --users 500 --skew 1.2
+    python -m benchmarks.dataset --database-url sqlite+aiosqlite:///benchmark.db --create-tables
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+
+from app.auth.utils import generate_passwd_hash
+from app.models.university import AcademicProgram, Language, Ranking, University, UniversityType
+from app.models.user import User
+
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+# Most frequent first: the skew favours the front of each list
+COUNTRIES = {
+    "Nigeria": ["Lagos", "Abuja", "Ibadan", "Enugu", "Port Harcourt", "Kano"],
+    "Ghana": ["Accra", "Kumasi", "Cape Coast"],
+    "Kenya": ["Nairobi", "Mombasa", "Kisumu"],
+    "South Africa": ["Johannesburg", "Cape Town", "Durban", "Pretoria"],
+    "Egypt": ["Cairo", "Alexandria"],
+    "Morocco": ["Rabat", "Casablanca"],
+    "Rwanda": ["Kigali"],
+    "Uganda": ["Kampala"],
+    "Tanzania": ["Dar es Salaam", "Dodoma"],
+    "Senegal": ["Dakar"],
+    "Cameroon": ["Yaoundé", "Douala"],
+    "Ethiopia": ["Addis Ababa"],
+}
+UNIVERSITY_TYPES = [
+    UniversityType.PRIVATE, UniversityType.PUBLIC, UniversityType.TECHNICAL,
+    UniversityType.RESEARCH, UniversityType.MEDICAL, UniversityType.AGRICULTURAL,
+]
+RANKINGS = [
+    Ranking.NOT_RANKED, Ranking.C, Ranking.B, Ranking.C_PLUS, Ranking.B_PLUS, Ranking.A, Ranking.A_PLUS,
+]
+NAME_PREFIXES = ["Federal", "State", "Covenant", "Pan-African", "Royal", "Metropolitan", "Crescent", "Unity"]
+NAME_SUFFIXES = ["University", "Institute of Technology", "University of Science", "Polytechnic"]
+
+# (name, degree type, faculty, department)
+PROGRAMS = [
+    ("Computer Science", "Bachelor's", "Science", "Computing"),
+    ("Software Engineering", "Bachelor's", "Engineering", "Computing"),
+    ("Data Science", "Master's", "Science", "Computing"),
+    ("Medicine and Surgery", "Bachelor's", "Medicine", "Clinical Sciences"),
+    ("Nursing", "Bachelor's", "Medicine", "Nursing"),
+    ("Public Health", "Master's", "Medicine", "Community Health"),
+    ("Law", "Bachelor's", "Law", "Law"),
+    ("Economics", "Bachelor's", "Social Sciences", "Economics"),
+    ("Accounting", "Bachelor's", "Business", "Accounting"),
+    ("Business Administration", "Master's", "Business", "Management"),
+    ("Civil Engineering", "Bachelor's", "Engineering", "Civil"),
+    ("Electrical Engineering", "Bachelor's", "Engineering", "Electrical"),
+    ("Mechanical Engineering", "Bachelor's", "Engineering", "Mechanical"),
+    ("Architecture", "Bachelor's", "Environmental Sciences", "Architecture"),
+    ("Agricultural Science", "Bachelor's", "Agriculture", "Crop Science"),
+    ("Pharmacy", "Bachelor's", "Pharmacy", "Pharmaceutics"),
+    ("Mass Communication", "Bachelor's", "Arts", "Communication"),
+    ("International Relations", "Master's", "Social Sciences", "Political Science"),
+    ("Petroleum Engineering", "Master's", "Engineering", "Petroleum"),
+    ("Education", "Bachelor's", "Education", "Curriculum Studies"),
+]
+
+
+def zipf_weights(count: int, skew: float) -> List[float]:
+    """Relative weight of each of `count` ranked options, 1 / rank ** skew"""
+    return [1 / rank ** skew for rank in range(1, count + 1)]
+
+
+class CatalogueGenerator:
+    """Reproducible rows for the universities, academic_programs and users tables"""
+
+    def __init__(self, universities: int, programs: int, users: int, skew: float = 1.0, seed: int = 2024):
+        self.universities = universities
+        self.programs = min(programs, len(PROGRAMS))
+        self.users = users
+        self.skew = skew
+        self.rng = random.Random(seed)
+        self.now = datetime.now()
+        self._countries = list(COUNTRIES)
+        self._country_weights = zipf_weights(len(self._countries), skew)
+        self._type_weights = zipf_weights(len(UNIVERSITY_TYPES), skew)
+        self._ranking_weights = zipf_weights(len(RANKINGS), skew)
+
+    def _pick(self, options: Sequence, weights: Sequence[float]):
+        return self.rng.choices(options, weights)[0]
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def university_rows(self) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """Each university row with the rows of its programs"""
+        rng = self.rng
+        for i in range(self.universities):
+            country = self._pick(self._countries, self._country_weights)
+            tuition = round(rng.lognormvariate(8.3, 0.7), 2) if rng.random() < 0.85 else None
+            stamp = self.now - timedelta(days=rng.randint(0, 365))
+            university = {
+                "uid": self._uuid(),
+                "name": f"{rng.choice(NAME_PREFIXES)} {rng.choice(NAME_SUFFIXES)} {i:06d}",
+                "website": f"https://university-{i}.example.edu",
+                "country": country,
+                "city": rng.choice(COUNTRIES[country]),
+                "founded_year": rng.randint(1900, 2022),
+                "university_type": self._pick(UNIVERSITY_TYPES, self._type_weights),
+                "ranking": self._pick(RANKINGS, self._ranking_weights),
+                "description": f"Synthetic university {i} for load benchmarks. " * rng.randint(2, 8),
+                "nigerian_students": rng.randint(0, 8000) if rng.random() < 0.8 else None,
+                "acceptance_rate": round(rng.uniform(3, 95), 1) if rng.random() < 0.9 else None,
+                "average_annual_tuition": tuition,
+                "contact_email": f"admissions@university-{i}.example.edu",
+                "languages_of_instruction": [Language.ENGLISH] + ([Language.FRENCH] if rng.random() < 0.15 else []),
+                "offers_scholarships": rng.random() < 0.4,
+                "provides_accommodation": rng.random() < 0.6,
+                "partner_university": rng.random() < 0.1,
+                "is_active": rng.random() < 0.97,
+                "created_at": stamp,
+                "updated_at": stamp,
+            }
+            programs = [
+                {
+                    "uid": self._uuid(),
+                    "university_uid": university["uid"],
+                    "name": name,
+                    "degree_type": degree_type,
+                    "faculty": faculty,
+                    "department": department,
+                    "duration_years": 2.0 if degree_type == "Master's" else float(rng.choice([4, 5, 6])),
+                    "tuition_fee": round(tuition * rng.uniform(0.8, 1.3), 2) if tuition else None,
+                    "is_active": True,
+                    "created_at": stamp,
+                    "updated_at": stamp,
+                }
+                for name, degree_type, faculty, department in rng.sample(PROGRAMS, self.programs)
+            ]
+            yield university, programs
+
+    def user_rows(self) -> Iterator[Dict]:
+        # One hash for everyone: bcrypt per user would dominate the seeding time
+        password_hash = generate_passwd_hash(BENCHMARK_PASSWORD)
+        for i in range(self.users):
+            yield {
+                "uid": self._uuid(),
+                "username": f"user{i}",
+                "email": user_email(i),
+                "last_name": "Benchmark",
+                "role": "Admin" if i == 0 else "regular",
+                "is_verified": True,
+                "password_hash": password_hash,
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+
+
+def user_email(index: int) -> str:
+    return f"user{index}@benchmark.example.com"
+
+
+async def seed(engine: AsyncEngine, generator: CatalogueGenerator, batch_size: int = 1000) -> Dict[str, int]:
+    """Insert the generated rows, one transaction per batch; returns the row count per table"""
+    counts = {"universities": 0, "academic_programs": 0, "users": 0}
+    universities, programs = [], []
+
+    async def flush():
+        async with engine.begin() as conn:
+            if universities:
+                await conn.execute(insert(University.__table__), universities)
+            if programs:
+                await conn.execute(insert(AcademicProgram.__table__), programs)
+        counts["universities"] += len(universities)
+        counts["academic_programs"] += len(programs)
+        universities.clear()
+        programs.clear()
+
+    for university, university_programs in generator.university_rows():
+        universities.append(university)
+        programs.extend(university_programs)
+        if len(universities) >= batch_size:
+            await flush()
+    await flush()
+
+    users = list(generator.user_rows())
+    for start in range(0, len(users), batch_size):
+        async with engine.begin() as conn:
+            await conn.execute(insert(User.__table__), users[start:start + batch_size])
+    counts["users"] = len(users)
+    return counts
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        from app.core.database import async_engine as engine
+
+    if args.create_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    generator = CatalogueGenerator(args.universities, args.programs, args.users, args.skew, args.seed)
+    start = time.perf_counter()
+    counts = await seed(engine, generator, args.batch_size)
+    elapsed = time.perf_counter() - start
+    print(", ".join(f"{count} {table}" for table, count in counts.items()) + f" in {elapsed:.1f}s")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--universities", type=int, default=5000)
+    parser.add_argument("--programs", type=int, default=10, help=f"Per university, at most {len(PROGRAMS)}")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--skew", type=float, default=1.0, help="0 for uniform; higher favours the first options")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--database-url", help="Defaults to the app's DATABASE_URL")
+    parser.add_argument("--create-tables", action="store_true", help="Create missing tables first")
+    main_args = parser.parse_args()
+    asyncio.run(main(main_args))
@@ -0,0 +1,292 @@
+"""
+Replay a realistic traffic mix against the API and report throughput and latency.
+
+Runs against the app in-process through httpx's ASGI transport, or against a
+running server (e.g. a local uvicorn) with --base-url. The mix of list,
+search, detail, login and admin-write requests is weighted and seeded, so
+two runs against the same catalogue send the same kinds of requests.
+Results go to a JSON file so runs can be diffed.
+
+Seed a catalogue first with benchmarks.dataset; logins and admin writes use
+its users.
+
+Usage (from the fastApi-app directory):
+    python -m benchmarks.load --database-url sqlite+aiosqlite:///benchmark.db --duration 30
+    python -m benchmarks.load --base-url http://127.0.0.1:8000 --concurrency 32 --output after.json
+    python -m benchmarks.load --mix list=60,detail=40 --requests 5000
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.dataset import BENCHMARK_PASSWORD, COUNTRIES, PROGRAMS, user_email
+
+
+DEFAULT_MIX = {
+    "list": 35,
+    "search": 20,
+    "detail": 25,
+    "programs": 5,
+    "login": 10,
+    "admin_write": 5,
+}
+
+PERCENTILES = (50, 90, 95, 99)
+
+SORTS = ["name", "ranking", "-ranking", "tuition", "-acceptance_rate", "founded_year"]
+SEARCH_TERMS = ["Federal", "Lagos", "Technology", "Nairobi Science", "Royal Polytechnic", "Covenant", "Accra"]
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    return samples[max(math.ceil(len(samples) * q / 100) - 1, 0)]
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    summary = {f"p{q}": round(percentile(ordered, q), 3) for q in PERCENTILES}
+    summary["mean"] = round(sum(ordered) / len(ordered), 3)
+    summary["max"] = round(ordered[-1], 3)
+    return summary
+
+
+class TrafficMix:
+    """The requests of each operation, with the state they need (university ids, admin token)"""
+
+    def __init__(self, client: httpx.AsyncClient, rng: random.Random, users: int):
+        self.client = client
+        self.rng = rng
+        self.users = users
+        self.university_ids: List[str] = []
+        self.admin_headers: Dict[str, str] = {}
+
+    async def prepare(self, sample_size: int = 500) -> None:
+        """Collect university ids to request and log in as the admin user"""
+        cursor = ""
+        while cursor is not None and len(self.university_ids) < sample_size:
+            response = await self.client.get("/universities/", params={"cursor": cursor, "limit": 100})
+            response.raise_for_status()
+            self.university_ids.extend(university["uid"] for university in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+
+        if not self.university_ids:
+            raise SystemExit("The catalogue is empty; seed it with benchmarks.dataset first")
+
+        response = await self.login(0)
+        response.raise_for_status()
+        self.admin_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    def operations(self) -> Dict[str, Callable[[], Awaitable[httpx.Response]]]:
+        return {
+            "list": self.list,
+            "search": self.search,
+            "detail": self.detail,
+            "programs": self.programs,
+            "login": lambda: self.login(self.rng.randrange(self.users)),
+            "admin_write": self.admin_write,
+        }
+
+    async def list(self) -> httpx.Response:
+        rng = self.rng
+        params = {"limit": rng.choice([20, 50, 100])}
+        if rng.random() < 0.5:
+            params["cursor"] = ""
+            params["sort"] = rng.choice(SORTS)
+        else:
+            params["skip"] = rng.choice([0, 0, 0, 20, 100])
+        if rng.random() < 0.5:
+            params["country"] = rng.choice(list(COUNTRIES)[:4])
+        if rng.random() < 0.2:
+            params["offers_scholarships"] = True
+        if rng.random() < 0.2:
+            params["max_tuition"] = rng.choice([2000, 5000, 10000])
+        return await self.client.get("/universities/", params=params)
+
+    async def search(self) -> httpx.Response:
+        if self.rng.random() < 0.6:
+            return await self.client.get("/universities/", params={"search": self.rng.choice(SEARCH_TERMS)})
+        return await self.client.get(
+            "/universities/programs/search",
+            params={"name": self.rng.choice(PROGRAMS)[0].split()[0], "limit": 50},
+        )
+
+    async def detail(self) -> httpx.Response:
+        return await self.client.get(f"/universities/{self.rng.choice(self.university_ids)}")
+
+    async def programs(self) -> httpx.Response:
+        return await self.client.get(f"/universities/{self.rng.choice(self.university_ids)}/programs")
+
+    async def login(self, user: int) -> httpx.Response:
+        return await self.client.post(
+            "/api/v1/auth/login", json={"email": user_email(user), "password": BENCHMARK_PASSWORD}
+        )
+
+    async def admin_write(self) -> httpx.Response:
+        return await self.client.put(
+            f"/universities/{self.rng.choice(self.university_ids)}",
+            json={"description": f"Updated by the load benchmark at {time.time():.0f}"},
+            headers=self.admin_headers,
+        )
+
+
+async def run(
+    client: httpx.AsyncClient,
+    mix: Dict[str, int],
+    concurrency: int,
+    duration: float,
+    requests: Optional[int],
+    users: int,
+    seed: int,
+) -> dict:
+    traffic = TrafficMix(client, random.Random(seed), users)
+    await traffic.prepare()
+    operations = traffic.operations()
+    names = [name for name in mix if mix[name] > 0]
+    weights = [mix[name] for name in names]
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    errors: Dict[str, int] = defaultdict(int)
+    sent = 0
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def worker():
+        nonlocal sent
+        while time.perf_counter() < deadline and (requests is None or sent < requests):
+            sent += 1
+            name = traffic.rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                response = await operations[name]()
+                status = str(response.status_code)
+                failed = response.status_code >= 400
+            except httpx.HTTPError as e:
+                status, failed = type(e).__name__, True
+            latencies[name].append((time.perf_counter() - start) * 1000)
+            statuses[name][status] += 1
+            if failed:
+                errors[name] += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    total = sum(len(samples) for samples in latencies.values())
+    return {
+        "requests": total,
+        "errors": sum(errors.values()),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2),
+        "latency_ms": latency_summary([sample for samples in latencies.values() for sample in samples]),
+        "operations": {
+            name: {
+                "requests": len(latencies[name]),
+                "errors": errors[name],
+                "throughput_rps": round(len(latencies[name]) / elapsed, 2),
+                "latency_ms": latency_summary(latencies[name]),
+                "status_codes": dict(statuses[name]),
+            }
+            for name in names
+        },
+    }
+
+
+def in_process_client(database_url: Optional[str]) -> httpx.AsyncClient:
+    """Client calling the app directly, optionally on another database than DATABASE_URL"""
+    from fastapi import Request
+
+    from app.main import app
+
+    if database_url:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlmodel.ext.asyncio.session import AsyncSession
+
+        from app.core.database import get_session, get_session_maker, mark_primary_write
+
+        engine = create_async_engine(database_url, pool_size=20, max_overflow=20)
+        session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def get_benchmark_session(request: Request):
+            async with session_maker() as session:
+                yield session
+                mark_primary_write(request, session)
+
+        app.dependency_overrides[get_session] = get_benchmark_session
+        app.dependency_overrides[get_session_maker] = lambda: session_maker
+
+    # Errors in the app become 500 responses in the report rather than ending the run
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=60)
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX or not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"Expected name=weight with a name from {', '.join(DEFAULT_MIX)}")
+        mix[name] = int(weight)
+    return mix
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.base_url:
+        client = httpx.AsyncClient(
+            base_url=args.base_url,
+            timeout=60,
+            limits=httpx.Limits(max_connections=args.concurrency),
+        )
+    else:
+        client = in_process_client(args.database_url)
+
+    async with client:
+        results = await run(client, args.mix, args.concurrency, args.duration, args.requests, args.users, args.seed)
+
+    report = {
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "target": args.base_url or "in-process",
+        "concurrency": args.concurrency,
+        "duration_seconds": args.duration,
+        "max_requests": args.requests,
+        "mix": args.mix,
+        "seed": args.seed,
+        **results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    print(f"{report['requests']} requests, {report['errors']} errors, {report['throughput_rps']} req/s")
+    print(f"{'operation':>12} {'requests':>9} {'errors':>7} " + " ".join(f"{f'p{q} ms':>9}" for q in PERCENTILES))
+    for name, operation in report["operations"].items():
+        latency = operation["latency_ms"]
+        print(
+            f"{name:>12} {operation['requests']:>9} {operation['errors']:>7} "
+            + " ".join(f"{latency.get(f'p{q}', 0):>9.2f}" for q in PERCENTILES)
+        )
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", help="Server to load, e.g. http://127.0.0.1:8000; in-process by default")
+    target.add_argument("--database-url", help="In-process only: database to serve instead of DATABASE_URL")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent simulated clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run for")
+    parser.add_argument("--requests", type=int, help="Stop after this many requests, if sooner")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="Weights, e.g. list=35,detail=25")
+    parser.add_argument("--users", type=int, default=100, help="Users seeded by benchmarks.dataset")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--output", default="benchmark-results.json")
+    main_args = parser.parse_args()
+    asyncio.run(main(main_args))
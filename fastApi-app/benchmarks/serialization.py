@@ -0,0 +1,96 @@
+"""
+Compare response serialization paths for university pages.
+
+"response_model" reproduces what the routes used to do: build models one by
+one with model_validate, then let FastAPI validate them again against the
+response_model and encode the result with json.dumps. "serializer" is the
+current path: one from_attributes validation and a direct dump to JSON bytes.
+
+Usage (from the fastApi-app directory):
+    python -m benchmarks.serialization [--rows 100] [--programs 10] [--repeat 200]
+"""
+import argparse
+import json
+import timeit
+import uuid
+from datetime import datetime
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.serialization import Serializer
+from app.models.university import AcademicProgram, University, UniversityListResponse, UniversityResponse
+
+
+def make_universities(rows: int, programs: int) -> List[University]:
+    now = datetime.now()
+    universities = []
+    for i in range(rows):
+        university = University(
+            uid=uuid.uuid4(),
+            name=f"University {i:04d}",
+            country="Ghana",
+            city="Accra",
+            university_type="public",
+            description="A university used for serialization benchmarks. " * 4,
+            languages_of_instruction=["English"],
+            average_annual_tuition=5000.0 + i,
+            created_at=now,
+            updated_at=now,
+        )
+        university.academic_programs = [
+            AcademicProgram(
+                uid=uuid.uuid4(),
+                university_uid=university.uid,
+                name=f"Program {j}",
+                degree_type="Bachelor's",
+                faculty="Science",
+                tuition_fee=4000.0,
+                created_at=now,
+                updated_at=now,
+            )
+            for j in range(programs)
+        ]
+        universities.append(university)
+    return universities
+
+
+def response_model_path(model, response_type):
+    """model_validate per item, then FastAPI's response_model validation and JSONResponse encoding"""
+    adapter = TypeAdapter(response_type)
+
+    def serialize(items):
+        content = [model.model_validate(item) for item in items]
+        validated = adapter.validate_python(content, from_attributes=True)
+        encoded = jsonable_encoder(adapter.dump_python(validated, mode="json"))
+        return json.dumps(encoded, ensure_ascii=False, separators=(",", ":")).encode()
+
+    return serialize
+
+
+def main(rows: int, programs: int, repeat: int) -> None:
+    universities = make_universities(rows, programs)
+    cases = {
+        "list page": (UniversityListResponse, List[UniversityListResponse]),
+        "detail pages": (UniversityResponse, List[UniversityResponse]),
+    }
+
+    print(f"{rows} universities with {programs} programs each, best of 5 x {repeat} runs")
+    for name, (model, response_type) in cases.items():
+        old = response_model_path(model, response_type)
+        new = Serializer(response_type).dump
+        assert json.loads(old(universities)) == json.loads(new(universities))
+
+        old_ms = min(timeit.repeat(lambda: old(universities), number=repeat, repeat=5)) / repeat * 1000
+        new_ms = min(timeit.repeat(lambda: new(universities), number=repeat, repeat=5)) / repeat * 1000
+        print(f"{name:>13}: response_model {old_ms:7.3f} ms  serializer {new_ms:7.3f} ms  ({old_ms / new_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--programs", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.rows, args.programs, args.repeat)
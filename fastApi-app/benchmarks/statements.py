@@ -0,0 +1,106 @@
+"""
+Compare building statements per request with reusing cached statements.
+
+"built" reproduces what the services used to do: construct a fresh statement
+with its values inlined for every call. "cached" is the current path: a
+statement kept per shape (or at module level) and executed with new params.
+Both are timed preparing the statement the way SQLAlchemy does before a
+compiled-cache lookup, and end to end against an in-memory SQLite database.
+
+Usage (from the fastApi-app directory):
+    python -m benchmarks.statements [--repeat 2000]
+"""
+import argparse
+import asyncio
+import time
+import timeit
+import uuid
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.auth.services import USER_BY_EMAIL
+from app.models.university import University, UniversityCreate
+from app.models.user import User
+from app.services.university_service import (
+    UNIVERSITY_BY_ID,
+    UNIVERSITY_LIST_COLUMNS,
+    UniversityService,
+    list_statements,
+)
+
+
+university_service = UniversityService()
+
+LIST_FILTERS = {"country": "Ghana", "min_tuition": 1000.0, "offers_scholarships": True, "sort": "-ranking"}
+
+
+def cases(university_id: uuid.UUID):
+    """Name -> (build a fresh statement, get the cached one, params for the cached one)"""
+    def list_built():
+        return university_service._offset_statement(
+            select(*UNIVERSITY_LIST_COLUMNS), "sqlite", 0, 20, **LIST_FILTERS
+        )
+
+    shape = university_service._statement_shape("summaries", "sqlite", **LIST_FILTERS)
+    list_params = {"skip": 0, "limit": 20, **university_service._bind_filters(LIST_FILTERS)}
+
+    return {
+        "list": (list_built, lambda: list_statements.get(shape, list_built), list_params),
+        "detail": (
+            lambda: select(University)
+            .options(selectinload(University.academic_programs))
+            .where(University.uid == university_id),
+            lambda: UNIVERSITY_BY_ID,
+            {"university_id": university_id},
+        ),
+        "user lookup": (
+            lambda: select(User).where(User.email == "reader@example.com"),
+            lambda: USER_BY_EMAIL,
+            {"email": "reader@example.com"},
+        ),
+    }
+
+
+async def execute_ms(session: AsyncSession, statement, params, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = await session.exec(statement(), params=params)
+        result.all()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        university = await university_service.create_university(
+            UniversityCreate(name="Benchmark University", country="Ghana", city="Accra", university_type="public"),
+            session,
+        )
+
+        print(f"best of 5 x {repeat} runs, per call")
+        for name, (built, cached, params) in cases(university.uid).items():
+            # The statement work SQLAlchemy does before it can reuse compiled SQL
+            built_us = min(timeit.repeat(lambda: built()._generate_cache_key(), number=repeat, repeat=5)) / repeat * 1e6
+            cached_us = min(timeit.repeat(lambda: cached()._generate_cache_key(), number=repeat, repeat=5)) / repeat * 1e6
+
+            built_ms = min([await execute_ms(session, built, {}, repeat) for _ in range(5)])
+            cached_ms = min([await execute_ms(session, cached, params, repeat) for _ in range(5)])
+            print(
+                f"{name:>11}: prepare built {built_us:7.1f} us  cached {cached_us:5.1f} us"
+                f"  | execute built {built_ms:6.3f} ms  cached {cached_ms:6.3f} ms  ({built_ms / cached_ms:.2f}x)"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,37 @@
+"""university keyset index
+
+Revision ID: 5c1e7a9d3b42
+Revises: 214793ff62f2
+Create Date: 2026-10-18 09:12:04.311522
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9d3b42'
+down_revision: Union[str, Sequence[str], None] = '214793ff62f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # init_db creates the model's indexes at startup, so the index may already exist
+    op.create_index(
+        'ix_universities_active_name_uid',
+        'universities',
+        ['name', 'uid'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_universities_active_name_uid', table_name='universities', if_exists=True)
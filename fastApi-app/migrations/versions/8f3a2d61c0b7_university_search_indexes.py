@@ -0,0 +1,50 @@
+"""university search indexes
+
+Revision ID: 8f3a2d61c0b7
+Revises: 5c1e7a9d3b42
+Create Date: 2026-10-18 10:02:47.190345
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a2d61c0b7'
+down_revision: Union[str, Sequence[str], None] = '5c1e7a9d3b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.services.search.university_search_document expression for expression
+SEARCH_DOCUMENT = """
+    setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A')
+    || setweight(to_tsvector('simple'::regconfig, (coalesce(city, '') || ' ') || coalesce(country, '')), 'B')
+    || setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C')
+"""
+
+TRIGRAM_COLUMNS = ['name', 'city', 'country', 'description']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        f'CREATE INDEX IF NOT EXISTS ix_universities_search_document '
+        f'ON universities USING gin (({SEARCH_DOCUMENT}))'
+    )
+    for column in TRIGRAM_COLUMNS:
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS ix_universities_{column}_trgm '
+            f'ON universities USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in TRIGRAM_COLUMNS:
+        op.execute(f'DROP INDEX IF EXISTS ix_universities_{column}_trgm')
+    op.execute('DROP INDEX IF EXISTS ix_universities_search_document')
@@ -0,0 +1,59 @@
+"""university sort indexes
+
+Revision ID: a7d4f1c3e952
+Revises: e2b7c5a19f06
+Create Date: 2026-10-18 15:21:09.482113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4f1c3e952'
+down_revision: Union[str, Sequence[str], None] = 'e2b7c5a19f06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SORT_COLUMNS = ('average_annual_tuition', 'acceptance_rate', 'founded_year', 'nigerian_students')
+
+# Must match university_ranking_order in app.models.university
+RANKING_ORDER = (
+    "(CASE WHEN (ranking = 'A_PLUS') THEN 0 WHEN (ranking = 'A') THEN 1 "
+    "WHEN (ranking = 'B_PLUS') THEN 2 WHEN (ranking = 'B') THEN 3 "
+    "WHEN (ranking = 'C_PLUS') THEN 4 WHEN (ranking = 'C') THEN 5 "
+    "WHEN (ranking = 'NOT_RANKED') THEN 6 ELSE 7 END)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # init_db creates the model's indexes at startup, so they may already exist
+    for column in SORT_COLUMNS:
+        op.create_index(
+            f'ix_universities_active_{column}_uid',
+            'universities',
+            [column, 'uid'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            if_not_exists=True,
+        )
+    op.create_index(
+        'ix_universities_active_ranking_order_uid',
+        'universities',
+        [sa.text(RANKING_ORDER), 'uid'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_universities_active_ranking_order_uid', table_name='universities', if_exists=True)
+    for column in reversed(SORT_COLUMNS):
+        op.drop_index(f'ix_universities_active_{column}_uid', table_name='universities', if_exists=True)
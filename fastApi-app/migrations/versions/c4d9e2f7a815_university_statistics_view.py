@@ -0,0 +1,56 @@
+"""university statistics view
+
+Revision ID: c4d9e2f7a815
+Revises: 8f3a2d61c0b7
+Create Date: 2026-10-18 11:40:13.552907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d9e2f7a815'
+down_revision: Union[str, Sequence[str], None] = '8f3a2d61c0b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same query as app.services.statistics.statistics_statement
+AGGREGATES = """
+    count(*) AS universities,
+    count(*) FILTER (WHERE offers_scholarships) AS with_scholarships,
+    count(*) FILTER (WHERE provides_accommodation) AS with_accommodation,
+    count(*) FILTER (WHERE partner_university) AS partner_universities
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW university_statistics AS
+        SELECT 'total' AS dimension, '' AS key, {AGGREGATES}
+        FROM universities WHERE is_active
+        UNION ALL
+        SELECT 'country', country, {AGGREGATES}
+        FROM universities WHERE is_active GROUP BY country
+        UNION ALL
+        SELECT 'type', university_type::text, {AGGREGATES}
+        FROM universities WHERE is_active GROUP BY university_type
+        UNION ALL
+        SELECT 'ranking', ranking::text, {AGGREGATES}
+        FROM universities WHERE is_active GROUP BY ranking
+    """)
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        'CREATE UNIQUE INDEX ix_university_statistics_dimension_key '
+        'ON university_statistics (dimension, key)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS university_statistics')
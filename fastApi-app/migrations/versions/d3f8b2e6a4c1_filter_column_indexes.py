@@ -0,0 +1,57 @@
+"""filter column indexes
+
+Revision ID: d3f8b2e6a4c1
+Revises: a7d4f1c3e952
+Create Date: 2026-10-18 16:48:33.907215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f8b2e6a4c1'
+down_revision: Union[str, Sequence[str], None] = 'a7d4f1c3e952'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial on is_active)
+# Country and city filters are ILIKE patterns served by the trigram indexes
+# of 8f3a2d61c0b7, so they get no btree of their own here
+INDEXES = (
+    ('ix_universities_ranking', 'universities', ['ranking'], False),
+    ('ix_universities_updated_at', 'universities', ['updated_at'], False),
+    ('ix_universities_active_country_city', 'universities', ['country', 'city'], True),
+    ('ix_universities_active_type_ranking', 'universities', ['university_type', 'ranking'], True),
+    ('ix_academic_programs_university_uid', 'academic_programs', ['university_uid'], False),
+    ('ix_users_email', 'users', ['email'], False),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable while the indexes build, but
+    # cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, partial in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text('is_active') if partial else None,
+                # init_db creates the model's indexes at startup, so they may already exist
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
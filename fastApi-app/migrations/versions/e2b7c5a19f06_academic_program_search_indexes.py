@@ -0,0 +1,64 @@
+"""academic program search indexes
+
+Revision ID: e2b7c5a19f06
+Revises: c4d9e2f7a815
+Create Date: 2026-10-18 14:37:52.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c5a19f06'
+down_revision: Union[str, Sequence[str], None] = 'c4d9e2f7a815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # init_db creates the model's indexes at startup, so they may already exist
+    op.create_index(
+        'ix_academic_programs_active_name_uid',
+        'academic_programs',
+        ['name', 'uid'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_academic_programs_active_degree_name_uid',
+        'academic_programs',
+        ['degree_type', 'name', 'uid'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_academic_programs_active_faculty_department',
+        'academic_programs',
+        ['faculty', 'department'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_academic_programs_active_tuition',
+        'academic_programs',
+        ['tuition_fee'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_academic_programs_active_tuition', table_name='academic_programs', if_exists=True)
+    op.drop_index('ix_academic_programs_active_faculty_department', table_name='academic_programs', if_exists=True)
+    op.drop_index('ix_academic_programs_active_degree_name_uid', table_name='academic_programs', if_exists=True)
+    op.drop_index('ix_academic_programs_active_name_uid', table_name='academic_programs', if_exists=True)
@@ -0,0 +1,39 @@
+"""
+Bulk-import universities from a JSONL or CSV file.
+
+Usage (from the fastApi-app directory):
+    python -m scripts.import_universities catalogue.jsonl
+    python -m scripts.import_universities catalogue.csv --batch-size 1000
+"""
+import argparse
+import asyncio
+import sys
+
+from app.core.database import async_session_maker
+from app.services.university_import import UniversityImportService, read_csv, read_jsonl
+
+
+async def main(path: str, file_format: str, batch_size: int) -> int:
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        records = read_csv(file) if file_format == "csv" else read_jsonl(file)
+        async with async_session_maker() as session:
+            report = await UniversityImportService().import_universities(
+                records, session, batch_size=batch_size
+            )
+
+    print(f"Received {report.received}, imported {report.imported}, failed {report.failed}")
+    for error in report.errors:
+        print(f"  row {error.row}: {error.error}", file=sys.stderr)
+
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-import universities from JSONL or CSV")
+    parser.add_argument("path", help="File to import")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows written per transaction")
+    args = parser.parse_args()
+
+    file_format = args.format or ("csv" if args.path.lower().endswith(".csv") else "jsonl")
+    sys.exit(asyncio.run(main(args.path, file_format, args.batch_size)))
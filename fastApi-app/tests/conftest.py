@@ -1,13 +1,24 @@
 import os
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
 
 # Load test environment variables before importing the app
 load_dotenv('.env.test')
+# Tests must not see responses cached in a shared Redis by earlier runs
+os.environ.setdefault("CACHE_ENABLED", "false")
 
 from app.core.config import Settings
+from fastapi import Request
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.main import app
+from app.core.database import get_session, get_session_maker, mark_primary_write
 
 @pytest.fixture
 def client():
@@ -22,3 +33,65 @@ def test_settings():
         JWT_SECRET="test-secret-key",
         JWT_ALGORITHM="HS256"
     )
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    """In-memory SQLite engine with the full schema"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session(db_engine):
+    """Session bound to the in-memory test database"""
+    session_maker = async_sessionmaker(bind=db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        yield session
+
+
+@pytest.fixture
+def engine_statements(db_engine):
+    """SQL statements sent to the test database while the fixture is active"""
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db_engine.sync_engine, "before_cursor_execute", listener)
+    yield statements
+    event.remove(db_engine.sync_engine, "before_cursor_execute", listener)
+
+
+@pytest_asyncio.fixture
+async def api_client(db_engine):
+    """Async client running the app in-process against the test database"""
+    session_maker = async_sessionmaker(bind=db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_test_session(request: Request):
+        async with session_maker() as session:
+            yield session
+            mark_primary_write(request, session)
+
+    app.dependency_overrides[get_session] = get_test_session
+    app.dependency_overrides[get_session_maker] = lambda: session_maker
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def as_admin():
+    """Treat every request as coming from an admin user"""
+    from app.auth.dependencies import get_admin_user
+    from app.models.user import User
+
+    app.dependency_overrides[get_admin_user] = lambda: User(
+        username="admin", email="admin@example.com", last_name="Admin", role="Admin", password_hash=""
+    )
+    yield
+    app.dependency_overrides.pop(get_admin_user, None)
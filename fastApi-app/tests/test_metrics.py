@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.metrics import Histogram, TimedQueuePool, instrument_engine, pool_checkout_wait, statement_duration
+from app.models.university import UniversityCreate
+from app.services.university_service import UniversityService
+
+
+university_service = UniversityService()
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("test_seconds", "Test timings", ["name"], buckets=(0.1, 1.0))
+    histogram.observe(0.05, name='say "hi"')
+    histogram.observe(0.5, name='say "hi"')
+    histogram.observe(3, name='say "hi"')
+
+    assert histogram.render() == [
+        "# HELP test_seconds Test timings",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{name="say \\"hi\\"",le="0.1"} 1',
+        'test_seconds_bucket{name="say \\"hi\\"",le="1.0"} 2',
+        'test_seconds_bucket{name="say \\"hi\\"",le="+Inf"} 3',
+        'test_seconds_sum{name="say \\"hi\\""} 3.55',
+        'test_seconds_count{name="say \\"hi\\""} 3',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_metrics_cover_routes_statements_and_pool(api_client, db_engine, db_session):
+    instrument_engine(db_engine, "test")
+    university = await university_service.create_university(
+        UniversityCreate(name="Metrics University", country="Ghana", city="Accra", university_type="public"),
+        db_session,
+    )
+
+    assert (await api_client.get(f"/universities/{university.uid}")).status_code == 200
+    assert (await api_client.get("/universities/", params={"country": "Ghana"})).status_code == 200
+    # The selectinload of the programs runs under the name of the statement that loads them
+    assert statement_duration.count(engine="test", query_name="universities.detail") == 2
+    assert statement_duration.count(engine="test", query_name="universities.list") == 1
+
+    response = await api_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/universities/{university_id}",status="200"} 1' in response.text
+    assert 'db_statement_duration_seconds_count{engine="test",query_name="universities.detail"} 2' in response.text
+
+    await api_client.get("/no-such-page")
+    response = await api_client.get("/metrics")
+    assert 'route="unmatched",status="404"' in response.text
+    assert "/no-such-page" not in response.text
+
+
+@pytest.mark.asyncio
+async def test_pool_records_checkout_waits():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=TimedQueuePool, pool_logging_name="waits", pool_size=1, max_overflow=0
+    )
+    instrument_engine(engine, "waits")
+
+    async def hold():
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(hold(), hold())
+    await engine.dispose()
+    assert pool_checkout_wait.count(engine="waits") == 2
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app.auth import utils
+from app.auth.utils import PasswordHasher
+from app.models.user import User
+
+
+def bcrypt_context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["bcrypt"], bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds, bcrypt__max_rounds=rounds
+    )
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_the_event_loop():
+    hasher = PasswordHasher(bcrypt_context(12), concurrency=1, queue_timeout=5)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    start = time.perf_counter()
+    await hasher.hash("correct horse")
+    elapsed = time.perf_counter() - start
+    ticker.cancel()
+
+    # A blocking hash would have left the ticker no turn at all
+    assert ticks >= elapsed / 0.005 / 4
+
+
+@pytest.mark.asyncio
+async def test_callers_past_the_queue_timeout_get_a_503():
+    hasher = PasswordHasher(bcrypt_context(12), concurrency=1, queue_timeout=0.01)
+
+    results = await asyncio.gather(hasher.hash("first"), hasher.hash("second"), return_exceptions=True)
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], HTTPException)
+    assert results[1].status_code == 503
+    assert results[1].headers == {"Retry-After": "1"}
+
+
+@pytest.mark.asyncio
+async def test_hashes_with_another_cost_are_replaced():
+    hasher = PasswordHasher(bcrypt_context(5), concurrency=2, queue_timeout=5)
+    old_hash = bcrypt_context(4).hash("secret")
+
+    assert await hasher.verify_and_update("wrong-password", old_hash) == (False, None)
+    valid, new_hash = await hasher.verify_and_update("secret", old_hash)
+    assert valid
+    assert "$05$" in new_hash
+    assert await hasher.verify_and_update("secret", new_hash) == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_login_checks_the_password_and_upgrades_the_hash(api_client, db_session, monkeypatch):
+    monkeypatch.setattr(utils, "password_hasher", PasswordHasher(bcrypt_context(5), concurrency=2, queue_timeout=5))
+    user = User(
+        username="ada", email="ada@example.com", last_name="Lovelace", is_verified=True,
+        password_hash=bcrypt_context(4).hash("s3cret-pass"),
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await api_client.post("/api/v1/auth/login", json={"email": "ada@example.com", "password": "wrong-password"})
+    assert response.status_code == 403
+    await db_session.refresh(user)
+    assert "$04$" in user.password_hash
+
+    response = await api_client.post("/api/v1/auth/login", json={"email": "ada@example.com", "password": "s3cret-pass"})
+    assert response.status_code == 200
+    await db_session.refresh(user)
+    assert "$05$" in user.password_hash
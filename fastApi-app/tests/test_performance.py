@@ -0,0 +1,372 @@
+"""
+Query-count and latency budgets for every endpoint.
+
+Each endpoint is called against a seeded catalogue with the response cache
+enabled over an in-memory Redis. The number of SQL statements and Redis
+calls it makes must stay within budget, both on a cache miss and when the
+response is served from Redis. When a change legitimately needs another
+round trip, lower or raise the budget in the same change so the cost is
+reviewed.
+
+The round trip counts are the real gate. Latency budgets only catch gross
+regressions: each is a multiple of the p95 of a trivial request sampled
+alongside it, so a slow or busy CI machine slows both alike.
+"""
+import math
+import random
+import time
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from app.auth.utils import create_access_token
+from app.core import redis as redis_module
+from app.core.cache import LocalCache, response_cache
+from app.models.university import AcademicProgram, Language, Ranking, University, UniversityType
+from app.models.user import User
+
+
+UNIVERSITIES = 300
+PROGRAMS_PER_UNIVERSITY = 8
+
+# Latency is sampled this many times per endpoint, after one warm-up call,
+# alternating with the baseline request its budget is relative to
+SAMPLES = 20
+BASELINE_PATH = "/health"
+
+COUNTRIES = ["Nigeria"] * 6 + ["Ghana"] * 3 + ["Kenya"] * 2 + ["South Africa", "Egypt", "Rwanda", "Morocco"]
+CITIES = {
+    "Nigeria": ["Lagos", "Abuja", "Ibadan", "Enugu"],
+    "Ghana": ["Accra", "Kumasi"],
+    "Kenya": ["Nairobi", "Mombasa"],
+    "South Africa": ["Cape Town", "Johannesburg"],
+    "Egypt": ["Cairo"],
+    "Rwanda": ["Kigali"],
+    "Morocco": ["Rabat"],
+}
+PROGRAMS = [
+    ("Computer Science", "Bachelor's", "Science"),
+    ("Medicine and Surgery", "Bachelor's", "Medicine"),
+    ("Law", "Bachelor's", "Law"),
+    ("Economics", "Bachelor's", "Social Sciences"),
+    ("Civil Engineering", "Bachelor's", "Engineering"),
+    ("Data Science", "Master's", "Science"),
+    ("Public Health", "Master's", "Medicine"),
+    ("Business Administration", "Master's", "Business"),
+    ("Accounting", "Bachelor's", "Business"),
+    ("Agricultural Science", "Bachelor's", "Agriculture"),
+]
+
+
+async def seed_catalogue(session) -> list:
+    """A deterministic catalogue, skewed towards a few countries like the real one"""
+    rng = random.Random(22)
+    universities = []
+    for i in range(UNIVERSITIES):
+        country = rng.choice(COUNTRIES)
+        university = University(
+            uid=uuid.uuid4(),
+            name=f"{rng.choice(['Federal', 'State', 'Covenant', 'Pan-African', 'Royal'])} University {i:03d}",
+            country=country,
+            city=rng.choice(CITIES[country]),
+            university_type=rng.choice(list(UniversityType)),
+            ranking=rng.choice(list(Ranking)),
+            founded_year=rng.randint(1900, 2020),
+            description="A university seeded for the performance budgets. " * 3,
+            nigerian_students=rng.randint(0, 5000),
+            acceptance_rate=round(rng.uniform(5, 90), 1),
+            average_annual_tuition=rng.choice([None, round(rng.uniform(500, 20000), 2)]),
+            languages_of_instruction=[Language.ENGLISH],
+            offers_scholarships=rng.random() < 0.4,
+            provides_accommodation=rng.random() < 0.6,
+            is_active=rng.random() < 0.95,
+        )
+        session.add(university)
+        for name, degree_type, faculty in rng.sample(PROGRAMS, PROGRAMS_PER_UNIVERSITY):
+            session.add(AcademicProgram(
+                university_uid=university.uid,
+                name=name,
+                degree_type=degree_type,
+                faculty=faculty,
+                tuition_fee=round(rng.uniform(500, 20000), 2),
+            ))
+        universities.append(university)
+
+    await session.commit()
+    return universities
+
+
+@pytest_asyncio.fixture
+async def catalogue(db_session):
+    universities = await seed_catalogue(db_session)
+    return {"university": next(university.uid for university in universities if university.is_active)}
+
+
+class FakeRedis:
+    """
+    In-memory Redis with the commands the response cache and token blocklist
+    use. Counts round trips: one per command, one per executed pipeline.
+    """
+
+    def __init__(self):
+        self.round_trips = 0
+        self._data = {}
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self._data.get(key)
+
+    async def set(self, name, value, ex=None):
+        self.round_trips += 1
+        self._data[name] = value.encode() if isinstance(value, str) else value
+
+    async def hgetall(self, key):
+        self.round_trips += 1
+        return dict(self._data.get(key, {}))
+
+    async def sunion(self, keys):
+        self.round_trips += 1
+        return set().union(*(self._data.get(key, set()) for key in keys))
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        for key in keys:
+            self._data.pop(key.decode() if isinstance(key, bytes) else key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self._commands = []
+
+    def hset(self, key, mapping):
+        self._commands.append(lambda data: data.setdefault(key, {}).update(
+            (name.encode(), value.encode() if isinstance(value, str) else value) for name, value in mapping.items()
+        ))
+
+    def expire(self, key, seconds):
+        pass
+
+    def sadd(self, key, *members):
+        self._commands.append(lambda data: data.setdefault(key, set()).update(
+            member.encode() for member in members
+        ))
+
+    async def execute(self):
+        self.client.round_trips += 1
+        for command in self._commands:
+            command(self.client._data)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Enable the response cache, with both its tiers starting empty"""
+    client = FakeRedis()
+    monkeypatch.setattr(response_cache, "client", client)
+    monkeypatch.setattr(response_cache, "enabled", True)
+    monkeypatch.setattr(response_cache, "local", LocalCache(max_entries=1000, ttl=60))
+    monkeypatch.setattr(response_cache, "notify_engine", None)
+    monkeypatch.setattr(response_cache, "_disabled_until", 0.0)
+    monkeypatch.setattr(redis_module, "token_blocklist", client)
+    return client
+
+
+def clear_cache(client: FakeRedis) -> None:
+    response_cache.local.clear()
+    client.clear()
+
+
+class RoundTrips:
+    """SQL statements sent to the test database and Redis round trips made since the last reset"""
+
+    def __init__(self, engine, redis_client: FakeRedis):
+        self.statements = 0
+        self._redis_client = redis_client
+        self._redis_start = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args) -> None:
+        self.statements += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self._redis_start = self._redis_client.round_trips
+
+    @property
+    def redis(self) -> int:
+        return self._redis_client.round_trips - self._redis_start
+
+
+@pytest.fixture
+def round_trips(db_engine, fake_redis):
+    trips = RoundTrips(db_engine, fake_redis)
+    yield trips
+    event.remove(db_engine.sync_engine, "before_cursor_execute", trips._count)
+
+
+def p95(samples: list) -> float:
+    ordered = sorted(samples)
+    return ordered[math.ceil(len(ordered) * 0.95) - 1]
+
+
+# (method, path, params, (max SQL statements, max Redis calls) on a cache miss,
+# the same when served from Redis, max p95 as a multiple of the baseline's).
+# Latency is sampled on the cache-miss path.
+READ_BUDGETS = [
+    ("GET", "/universities/", {}, (2, 2), (0, 1), 40),
+    ("GET", "/universities/", {"country": "Nigeria", "offers_scholarships": True}, (2, 2), (0, 1), 40),
+    ("GET", "/universities/", {"cursor": "", "sort": "-ranking", "min_tuition": 1000}, (2, 2), (0, 1), 40),
+    ("GET", "/universities/", {"search": "Federal Lagos"}, (2, 2), (0, 1), 40),
+    ("GET", "/universities/", {"count": "exact"}, (3, 2), (0, 1), 40),
+    # Only the facet counts are cached; the page of results is read each time
+    ("GET", "/universities/facets", {"country": "Ghana"}, (2, 2), (1, 1), 40),
+    ("GET", "/universities/programs/search", {"name": "Science", "max_tuition": 10000}, (1, 2), (0, 1), 30),
+    ("GET", "/universities/{university}", {}, (3, 2), (0, 1), 30),
+    ("GET", "/universities/{university}/programs", {}, (2, 2), (0, 1), 30),
+    ("GET", "/universities/statistics/summary", {}, (1, 0), (1, 0), 30),
+    ("GET", "/universities/enums/types", {}, (0, 0), (0, 0), 5),
+]
+
+
+def assert_within(round_trips: RoundTrips, budget: tuple, request: str) -> None:
+    max_statements, max_redis = budget
+    assert round_trips.statements <= max_statements, f"{request} ran {round_trips.statements} SQL statements"
+    assert round_trips.redis <= max_redis, f"{request} made {round_trips.redis} Redis calls"
+
+
+async def check_read_budgets(
+    api_client, fake_redis, round_trips, method, url, params, headers, miss, hit, p95_ratio
+):
+    request = f"{method} {url}" + (" (authenticated)" if headers else "")
+
+    round_trips.reset()
+    response = await api_client.request(method, url, params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    assert_within(round_trips, miss, f"{request} on a cache miss")
+
+    # A worker without a local copy of the response reads it from Redis
+    response_cache.local.clear()
+    round_trips.reset()
+    assert (await api_client.request(method, url, params=params, headers=headers)).content == response.content
+    assert_within(round_trips, hit, f"{request} served from Redis")
+
+    # and then serves it from its local copy; a bearer token is still checked against the blocklist
+    round_trips.reset()
+    assert (await api_client.request(method, url, params=params, headers=headers)).content == response.content
+    local_redis = 1 if headers else 0
+    assert round_trips.redis == local_redis, f"{request} made {round_trips.redis} Redis calls on a local hit"
+
+    durations, baseline = [], []
+    for _ in range(SAMPLES):
+        start = time.perf_counter()
+        assert (await api_client.get(BASELINE_PATH)).status_code == 200
+        baseline.append((time.perf_counter() - start) * 1000)
+
+        clear_cache(fake_redis)
+        start = time.perf_counter()
+        response = await api_client.request(method, url, params=params, headers=headers)
+        durations.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+
+    assert p95(durations) <= p95(baseline) * p95_ratio, (
+        f"{request} p95 {p95(durations):.1f} ms over {p95_ratio} x {p95(baseline):.1f} ms of GET {BASELINE_PATH}"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, path, params, miss, hit, p95_ratio", READ_BUDGETS)
+async def test_read_budgets(
+    api_client, as_admin, catalogue, fake_redis, round_trips, method, path, params, miss, hit, p95_ratio
+):
+    await check_read_budgets(
+        api_client, fake_redis, round_trips, method, path.format(**catalogue), params, None, miss, hit, p95_ratio
+    )
+
+
+@pytest_asyncio.fixture
+async def bearer(db_session):
+    """Authorization header of a verified user, with an access token like the one login issues"""
+    user = User(
+        username="reader", email="reader@example.com", last_name="Reader", is_verified=True, password_hash=""
+    )
+    db_session.add(user)
+    await db_session.commit()
+    token = create_access_token({"email": user.email, "user_uid": str(user.uid), "role": user.role})
+    return {"Authorization": f"Bearer {token}"}
+
+
+# The same reads by a signed-in user: the token is checked against the blocklist
+# in Redis and the optional user lookup adds a statement, hit or miss
+AUTHENTICATED_READ_BUDGETS = [
+    ("GET", "/universities/", {}, (3, 3), (1, 2), 40),
+    ("GET", "/universities/facets", {"country": "Ghana"}, (3, 3), (2, 2), 40),
+    ("GET", "/universities/programs/search", {"name": "Science", "max_tuition": 10000}, (2, 3), (1, 2), 30),
+    ("GET", "/universities/{university}", {}, (4, 3), (1, 2), 30),
+    ("GET", "/universities/{university}/programs", {}, (3, 3), (1, 2), 30),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, path, params, miss, hit, p95_ratio", AUTHENTICATED_READ_BUDGETS)
+async def test_authenticated_read_budgets(
+    api_client, catalogue, bearer, fake_redis, round_trips, method, path, params, miss, hit, p95_ratio
+):
+    await check_read_budgets(
+        api_client, fake_redis, round_trips, method, path.format(**catalogue), params, bearer, miss, hit, p95_ratio
+    )
+
+
+# Writes change the catalogue, so each is measured once rather than sampled.
+# Invalidating the cached responses they affect costs two Redis calls.
+WRITE_BUDGETS = [
+    ("POST", "/universities/", {
+        "name": "Budget University", "country": "Ghana", "city": "Accra", "university_type": "public",
+        "academic_programs": [{"name": "Law", "degree_type": "Bachelor's"}],
+    }, 4, 2),
+    ("PUT", "/universities/{university}", {"description": "Updated"}, 5, 2),
+    ("PATCH", "/universities/", {"filter": {"country": "Kenya"}, "fields": {"offers_scholarships": True}}, 1, 2),
+    ("POST", "/universities/deactivate", {"filter": {"country": "Rwanda"}}, 2, 2),
+    ("DELETE", "/universities/{university}", None, 2, 2),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, path, body, max_statements, max_redis", WRITE_BUDGETS)
+async def test_write_budgets(api_client, as_admin, catalogue, round_trips, method, path, body, max_statements, max_redis):
+    round_trips.reset()
+    response = await api_client.request(method, path.format(**catalogue), json=body)
+    assert response.status_code < 300, response.text
+    assert round_trips.statements <= max_statements, f"{method} {path} ran {round_trips.statements} SQL statements"
+    assert round_trips.redis <= max_redis, f"{method} {path} made {round_trips.redis} Redis calls"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path, params", [
+    ("/universities/", {}),
+    ("/universities/programs/search", {}),
+])
+async def test_statements_do_not_grow_with_result_size(api_client, as_admin, catalogue, round_trips, path, params):
+    round_trips.reset()
+    await api_client.get(path, params={**params, "limit": 1, "country": "Morocco"})
+    small = round_trips.statements
+
+    round_trips.reset()
+    await api_client.get(path, params={**params, "limit": 100})
+    assert round_trips.statements == small
+
+
+@pytest.mark.asyncio
+async def test_export_streams_in_a_fixed_number_of_statements(api_client, as_admin, catalogue, round_trips):
+    round_trips.reset()
+    response = await api_client.get("/universities/export", params={"include_programs": True})
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) > 250
+    assert round_trips.statements <= 1
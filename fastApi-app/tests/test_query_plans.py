@@ -0,0 +1,117 @@
+"""
+Guard against service queries that fall back to full table scans.
+
+Every SELECT issued by the services is run through SQLite's EXPLAIN QUERY
+PLAN; a bare "SCAN <table>" step (a table scan not driven by an index) on a
+seeded table fails the test. Each index used here also exists on Postgres.
+"""
+import re
+
+import pytest
+from sqlalchemy import event
+
+from app.auth.services import UserService
+from app.models.university import UniversityCreate, AcademicProgramCreate, UniversitySort
+from app.services.pagination import encode_cursor
+from app.services.university_service import UniversityService, AcademicProgramService
+
+
+university_service = UniversityService()
+program_service = AcademicProgramService()
+
+SEEDED_TABLES = ("universities", "academic_programs", "users")
+TABLE_SCAN = re.compile(rf"^SCAN ({'|'.join(SEEDED_TABLES)})$")
+
+
+async def seed(session):
+    universities = []
+    for i in range(20):
+        universities.append(await university_service.create_university(
+            UniversityCreate(
+                name=f"University {i:02d}",
+                country=("Ghana", "Kenya", "Egypt")[i % 3],
+                city=("Accra", "Nairobi", "Cairo")[i % 3],
+                university_type="public" if i % 2 else "private",
+                average_annual_tuition=1000.0 * i,
+                academic_programs=[
+                    AcademicProgramCreate(name=f"Program {j}", degree_type="Bachelor's", faculty="Science")
+                    for j in range(3)
+                ],
+            ),
+            session,
+        ))
+    return universities
+
+
+async def query_plans(db_engine, run):
+    """Run `run()` and return (statement, plan steps) for every SELECT it executed"""
+    executions = []
+    listener = lambda conn, cursor, statement, parameters, *args: executions.append((statement, parameters))
+    event.listen(db_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        await run()
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", listener)
+
+    plans = []
+    async with db_engine.connect() as conn:
+        for statement, parameters in executions:
+            if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                plans.append((statement, [row[-1] for row in plan]))
+    return plans
+
+
+@pytest.mark.asyncio
+async def test_service_queries_do_not_scan_tables(db_engine, db_session):
+    universities = await seed(db_session)
+    uid = universities[0].uid
+
+    async def run():
+        await university_service.get_university_summaries(db_session, limit=10)
+        await university_service.get_university_summaries(db_session, limit=10, university_type="public", ranking="NOT_RANKED")
+        await university_service.get_universities_page(db_session, cursor="", limit=10)
+        await university_service.get_universities_page(db_session, cursor="", limit=10, sort=UniversitySort.TUITION_DESC)
+        await university_service.get_universities_page(
+            db_session, cursor=encode_cursor([None, uid]), limit=10, sort=UniversitySort.TUITION
+        )
+        await university_service.get_universities_page(db_session, cursor="", limit=10, sort=UniversitySort.RANKING)
+        await university_service.get_university_facets(db_session)
+        await university_service.count_universities(db_session, mode="capped", cap=5)
+        await university_service.get_catalogue_version(db_session)
+        await university_service.get_university_version(uid, db_session)
+        await university_service.get_university_by_id(uid, db_session)
+        await program_service.get_programs_by_university(uid, db_session)
+        await program_service.search_programs(db_session, limit=10, degree_type="Bachelor's")
+        await UserService().get_user_by_email("someone@example.com", db_session)
+
+    scans = [
+        (statement, step)
+        for statement, steps in await query_plans(db_engine, run)
+        for step in steps
+        if TABLE_SCAN.match(step)
+    ]
+    assert not scans, "\n\n".join(f"{step}\n{statement}" for statement, step in scans)
+
+
+@pytest.mark.asyncio
+async def test_each_filter_index_serves_its_query(db_engine, db_session):
+    """Every single-column and filter index earns its write cost on a real read path"""
+    universities = await seed(db_session)
+    uid = universities[0].uid
+
+    expected = [
+        ("ix_universities_ranking", lambda: university_service.get_university_summaries(
+            db_session, limit=10, ranking="NOT_RANKED")),
+        ("ix_universities_active_type_ranking", lambda: university_service.get_university_summaries(
+            db_session, limit=10, university_type="public")),
+        ("ix_universities_active_country_city", lambda: university_service.get_university_facets(db_session)),
+        ("ix_universities_updated_at", lambda: university_service.get_catalogue_version(db_session)),
+        ("ix_academic_programs_university_uid", lambda: program_service.get_programs_by_university(uid, db_session)),
+        ("ix_users_email", lambda: UserService().get_user_by_email("someone@example.com", db_session)),
+    ]
+
+    for index, call in expected:
+        plans = await query_plans(db_engine, call)
+        steps = [step for _, query_steps in plans for step in query_steps]
+        assert any(index in step for step in steps), f"{index} not used:\n" + "\n".join(steps)
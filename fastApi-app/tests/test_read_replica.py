@@ -0,0 +1,80 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import database
+from app.core.database import ReplicaLag, READ_YOUR_WRITES_COOKIE
+from app.models.university import UniversityCreate
+from app.services.university_service import UniversityService
+
+
+university_service = UniversityService()
+
+
+@pytest_asyncio.fixture
+async def replica(monkeypatch):
+    """A second SQLite database standing in for the read replica"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    lag = ReplicaLag(engine, max_lag=5, check_interval=0)
+    monkeypatch.setattr(database, "read_session_maker", session_maker)
+    monkeypatch.setattr(database, "replica_lag", lag)
+
+    async with session_maker() as session:
+        yield session, lag
+    await engine.dispose()
+
+
+async def create(session, name: str):
+    return await university_service.create_university(
+        UniversityCreate(name=name, country="Ghana", city="Accra", university_type="public"), session
+    )
+
+
+async def listed_names(api_client):
+    response = await api_client.get("/universities/")
+    assert response.status_code == 200
+    return sorted(uni["name"] for uni in response.json())
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_until_the_client_writes(api_client, db_session, replica, as_admin):
+    replica_session, _ = replica
+    await create(db_session, "Primary Uni")
+    await create(replica_session, "Replica Uni")
+
+    assert await listed_names(api_client) == ["Replica Uni"]
+
+    response = await api_client.post("/universities/", json={
+        "name": "Written Uni", "country": "Ghana", "city": "Accra", "university_type": "public",
+    })
+    assert READ_YOUR_WRITES_COOKIE in response.headers["set-cookie"]
+
+    # The cookie pins this client to the primary, which has its write
+    assert await listed_names(api_client) == ["Primary Uni", "Written Uni"]
+
+    api_client.cookies.clear()
+    assert await listed_names(api_client) == ["Replica Uni"]
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_to_primary(api_client, db_session, replica):
+    replica_session, lag = replica
+    await create(db_session, "Primary Uni")
+    await create(replica_session, "Replica Uni")
+
+    lag.max_lag = -1
+    assert await listed_names(api_client) == ["Primary Uni"]
+
+    lag.max_lag = 5
+    assert await listed_names(api_client) == ["Replica Uni"]
@@ -0,0 +1,52 @@
+import json
+import logging
+
+import pytest
+
+from app.core import timing
+from app.core.serialization import Serializer
+from app.core.timing import RequestTimings, request_timings
+from app.models.university import UniversityCreate
+from app.services.university_service import UniversityService
+
+
+university_service = UniversityService()
+
+
+def test_timings_are_only_recorded_inside_a_request():
+    serializer = Serializer(list)
+    serializer.dump([1])
+
+    timings = RequestTimings()
+    token = request_timings.set(timings)
+    try:
+        serializer.dump([1])
+        serializer.dump([2])
+    finally:
+        request_timings.reset(token)
+
+    assert timings.counts == {"serialize": 2}
+    assert timings.header().startswith('serialize;dur=')
+    assert 'desc="Serialization (2)"' in timings.header()
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_and_slow_request_log(api_client, db_session, monkeypatch, caplog):
+    await university_service.create_university(
+        UniversityCreate(name="Timed University", country="Ghana", city="Accra", university_type="public"),
+        db_session,
+    )
+    monkeypatch.setattr(timing.Config, "SLOW_REQUEST_LOG_SECONDS", 0.0)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.timing"):
+        response = await api_client.get("/universities/")
+
+    assert response.status_code == 200
+    entries = {entry.split(";")[0]: entry for entry in response.headers["Server-Timing"].split(", ")}
+    assert {"db", "serialize", "total"} <= entries.keys()
+
+    [record] = [record for record in caplog.records if record.name == "app.core.timing"]
+    logged = json.loads(record.getMessage().removeprefix("slow request "))
+    assert logged["route"] == "/universities/"
+    assert logged["status"] == 200
+    assert logged["counts"]["db"] >= 2
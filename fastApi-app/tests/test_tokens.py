@@ -0,0 +1,87 @@
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.auth import dependencies, utils
+from app.auth.dependencies import AccessTokenBearer, OptionalTokenBearer, RefreshTokenBearer
+from app.auth.utils import create_access_token, decode_token_cached, verified_tokens
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Tokens passed to decode_token while the fixture is active"""
+    verified_tokens.clear()
+    tokens = []
+    decode_token = utils.decode_token
+
+    def counting_decode(token):
+        tokens.append(token)
+        return decode_token(token)
+
+    monkeypatch.setattr(utils, "decode_token", counting_decode)
+    yield tokens
+    verified_tokens.clear()
+
+
+def bearer_request(token: str) -> Request:
+    return Request({"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())]})
+
+
+@pytest.mark.asyncio
+async def test_bearers_verify_each_token_once(decodes, monkeypatch):
+    async def not_revoked(jti):
+        return False
+
+    monkeypatch.setattr(dependencies, "token_in_blocklist", not_revoked)
+    access = create_access_token({"email": "ada@example.com", "user_uid": "1"})
+    refresh = create_access_token({"email": "ada@example.com", "user_uid": "1"}, refresh=True)
+
+    for _ in range(3):
+        assert (await AccessTokenBearer()(bearer_request(access)))["refresh"] is False
+        assert (await OptionalTokenBearer()(bearer_request(access)))["refresh"] is False
+        assert (await RefreshTokenBearer()(bearer_request(refresh)))["refresh"] is True
+
+    assert decodes == [access, refresh]
+
+
+@pytest.mark.asyncio
+async def test_revoked_tokens_are_rejected_even_when_cached(decodes, monkeypatch):
+    revoked = set()
+
+    async def in_blocklist(jti):
+        return jti in revoked
+
+    monkeypatch.setattr(dependencies, "token_in_blocklist", in_blocklist)
+    token = create_access_token({"email": "ada@example.com", "user_uid": "1"})
+    token_data = await AccessTokenBearer()(bearer_request(token))
+
+    revoked.add(token_data["jti"])
+    with pytest.raises(HTTPException) as error:
+        await AccessTokenBearer()(bearer_request(token))
+    assert error.value.detail == "Token has been revoked"
+    assert await OptionalTokenBearer()(bearer_request(token)) is None
+
+
+def test_invalid_and_expired_tokens_are_not_cached(decodes):
+    token = create_access_token({"user_uid": "1"})
+
+    assert decode_token_cached(token + "x") is None
+    assert decode_token_cached(token + "x") is None
+    assert len(decodes) == 2
+
+    expired = create_access_token({"user_uid": "1"}, expiry=timedelta(seconds=-5))
+    assert decode_token_cached(expired) is None
+    assert len(verified_tokens) == 0
+
+
+def test_cached_claims_expire_with_the_token(decodes):
+    token = create_access_token({"user_uid": "1"}, expiry=timedelta(seconds=1))
+    token_data = decode_token_cached(token)
+    assert decode_token_cached(token) is token_data
+
+    time.sleep(max(token_data["exp"] - time.time(), 0) + 0.05)
+    assert decode_token_cached(token) is None
+    assert len(decodes) == 2
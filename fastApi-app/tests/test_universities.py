@@ -0,0 +1,595 @@
+import base64
+import gzip
+import json
+import uuid
+
+import pytest
+
+from app.models.university import UniversityCreate, AcademicProgramCreate
+from app.services.university_service import UniversityService
+from app.services.pagination import encode_cursor, decode_cursor
+
+
+university_service = UniversityService()
+
+
+async def seed_universities(session, count: int = 5):
+    """Create `count` active universities named University 00, University 01, ..."""
+    universities = []
+    for i in range(count):
+        university = await university_service.create_university(
+            UniversityCreate(
+                name=f"University {i:02d}",
+                country="Ghana" if i % 2 == 0 else "Kenya",
+                city="Accra" if i % 2 == 0 else "Nairobi",
+                university_type="public",
+                academic_programs=[
+                    AcademicProgramCreate(name="Computer Science", degree_type="Bachelor's")
+                ],
+            ),
+            session,
+        )
+        universities.append(university)
+    return universities
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(["University 01", "b6f0c6f8-3c1e-4a53-9b39-0b5b1c1f3e7d"])
+    assert decode_cursor(cursor, 2) == ["University 01", "b6f0c6f8-3c1e-4a53-9b39-0b5b1c1f3e7d"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_every_row_once(db_session):
+    await seed_universities(db_session, 5)
+
+    seen, cursor = [], ""
+    while True:
+        page, cursor = await university_service.get_universities_page(db_session, cursor=cursor, limit=2)
+        seen.extend(uni.name for uni in page)
+        if cursor is None:
+            break
+
+    assert seen == [f"University {i:02d}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_cursor_mode(api_client, db_session):
+    await seed_universities(db_session, 3)
+
+    response = await api_client.get("/universities/", params={"cursor": "", "limit": 2})
+    assert response.status_code == 200
+    assert [u["name"] for u in response.json()] == ["University 00", "University 01"]
+
+    next_cursor = response.headers["X-Next-Cursor"]
+    response = await api_client.get("/universities/", params={"cursor": next_cursor, "limit": 2})
+    assert [u["name"] for u in response.json()] == ["University 02"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_rejects_bad_cursor(api_client):
+    response = await api_client.get("/universities/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    # Well-formed JSON whose uid is not a string
+    for values in (["a", 5], ["a", [1]], ["a", None]):
+        cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+        for path in ("/universities/", "/universities/facets"):
+            response = await api_client.get(path, params={"cursor": cursor})
+            assert response.status_code == 400, (path, values)
+
+
+@pytest.mark.asyncio
+async def test_search_matches_every_word_and_ranks_name_matches_first(db_session):
+    await seed_universities(db_session, 4)
+    await university_service.create_university(
+        UniversityCreate(
+            name="Accra Technical University",
+            country="Ghana",
+            city="Accra",
+            university_type="technical",
+        ),
+        db_session,
+    )
+
+    results = await university_service.get_universities(db_session, search="accra")
+    assert results[0].name == "Accra Technical University"
+    assert {uni.city for uni in results} == {"Accra"}
+
+    results = await university_service.get_universities(db_session, search="nairobi kenya")
+    assert {uni.name for uni in results} == {"University 01", "University 03"}
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_selects_only_summary_columns(api_client, db_session, db_engine):
+    from sqlalchemy import event
+
+    await seed_universities(db_session, 2)
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        response = await api_client.get("/universities/")
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert not any("academic_programs" in statement for statement in statements)
+    assert "universities.description" not in statements[-1]
+
+
+def test_cache_key_normalizes_parameters():
+    from app.core.cache import response_cache
+    from app.models.university import UniversityType
+
+    key = response_cache.key("universities:list", {"country": "Ghana", "university_type": UniversityType.PUBLIC, "city": None})
+    assert key == response_cache.key("universities:list", {"university_type": "public", "country": "Ghana"})
+    assert key != response_cache.key("universities:list", {"university_type": "public", "country": "Kenya"})
+
+
+def test_local_cache_evicts_least_recently_used_and_by_tag():
+    from app.core.cache import LocalCache
+
+    cache = LocalCache(max_entries=2, ttl=60)
+    cache.set("a", 1, tags=["university:1"])
+    cache.set("b", 2, tags=["universities"])
+    cache.get("a")
+    cache.set("c", 3, tags=["universities"])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.invalidate("universities")
+    assert cache.get("c") is None
+    assert cache.get("a") == 1
+
+
+def test_local_cache_expires_entries():
+    from app.core.cache import LocalCache
+
+    cache = LocalCache(max_entries=10, ttl=60)
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_announced_after_redis_is_cleared():
+    from app.core.cache import LocalCache, ResponseCache
+
+    events = []
+
+    class Redis:
+        async def sunion(self, keys):
+            return [b"cache:v1:universities:list:1"]
+
+        async def delete(self, *keys):
+            events.append("redis delete")
+
+    class Cache(ResponseCache):
+        async def publish_invalidation(self, *tags):
+            events.append(("notify", tags))
+
+    cache = Cache(Redis(), ttl=60, local=LocalCache(max_entries=10, ttl=60))
+    await cache.invalidate("universities")
+
+    # Announced first, another worker could copy the stale Redis entry back into its local cache
+    assert events == ["redis delete", ("notify", ("universities",))]
+
+
+@pytest.mark.asyncio
+async def test_statistics_are_aggregated_in_sql(db_session):
+    await seed_universities(db_session, 3)
+    await university_service.create_university(
+        UniversityCreate(
+            name="Inactive University",
+            country="Ghana",
+            city="Accra",
+            university_type="private",
+            offers_scholarships=True,
+            is_active=False,
+        ),
+        db_session,
+    )
+
+    stats = await university_service.get_university_statistics(db_session)
+
+    assert stats == {
+        "total_universities": 3,
+        "by_country": {"Ghana": 2, "Kenya": 1},
+        "by_type": {"public": 3},
+        "by_ranking": {"NOT_RANKED": 3},
+        "with_scholarships": 0,
+        "with_accommodation": 0,
+        "partner_universities": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304_until_university_changes(api_client, db_session):
+    from app.models.university import UniversityUpdate
+
+    university = (await seed_universities(db_session, 1))[0]
+    url = f"/universities/{university.uid}"
+
+    response = await api_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert "Last-Modified" in response.headers
+    assert response.headers["Cache-Control"].startswith("public")
+
+    response = await api_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    await university_service.update_university(university.uid, UniversityUpdate(ranking="A"), db_session)
+
+    response = await api_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_and_enum_endpoints_answer_conditional_requests(api_client, db_session):
+    await seed_universities(db_session, 2)
+
+    response = await api_client.get("/universities/")
+    response = await api_client.get("/universities/", headers={"If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 304
+
+    response = await api_client.get("/universities/enums/types")
+    assert "immutable" in response.headers["Cache-Control"]
+    response = await api_client.get("/universities/enums/types", headers={"If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 304
+
+
+def test_gzip_variant_has_its_own_etag():
+    from starlette.requests import Request
+
+    from app.core.cache import CachedResponse, ResponseCache
+    from app.core.http_cache import is_not_modified, not_modified_response
+
+    def request(**headers):
+        return Request({"type": "http", "headers": [(name.replace("_", "-").encode(), value.encode())
+                                                    for name, value in headers.items()]})
+
+    cache = ResponseCache(None, ttl=60)
+    entry = CachedResponse(body=gzip.compress(b"[]"), headers={"ETag": '"abc"'})
+
+    assert cache.render(entry, request()).headers["ETag"] == '"abc"'
+    gzipped = cache.render(entry, request(accept_encoding="gzip, br"))
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.headers["ETag"] == '"abc-gzip"'
+
+    revalidation = request(if_none_match='"abc-gzip"')
+    assert is_not_modified(revalidation, entry.headers)
+    assert is_not_modified(request(if_none_match='W/"abc"'), entry.headers)
+    assert not_modified_response(entry.headers, revalidation).headers["ETag"] == '"abc-gzip"'
+    assert not_modified_response(entry.headers, request(if_none_match='"abc"')).headers["ETag"] == '"abc"'
+
+
+@pytest.mark.asyncio
+async def test_export_streams_ndjson_with_programs(api_client, db_session, as_admin):
+    import json
+
+    await seed_universities(db_session, 3)
+
+    response = await api_client.get("/universities/export", params={"include_programs": True})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["name"] for line in lines) == ["University 00", "University 01", "University 02"]
+    assert all(len(line["academic_programs"]) == 1 for line in lines)
+    assert lines[0]["university_type"] == "public"
+
+
+@pytest.mark.asyncio
+async def test_export_streams_csv(api_client, db_session, as_admin):
+    import csv
+    import io
+
+    await seed_universities(db_session, 2)
+
+    response = await api_client.get("/universities/export", params={"format": "csv"})
+    assert response.status_code == 200
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted(row["name"] for row in rows) == ["University 00", "University 01"]
+    assert rows[0]["languages_of_instruction"] == "[]"
+
+
+@pytest.mark.asyncio
+async def test_import_reports_bad_rows_and_loads_the_rest(api_client, db_session, as_admin):
+    import json
+
+    rows = [
+        {"name": "Imported One", "country": "Ghana", "city": "Accra", "university_type": "public",
+         "academic_programs": [{"name": "Law", "degree_type": "Bachelor's"}]},
+        {"name": "Missing Type", "country": "Ghana", "city": "Accra"},
+        {"name": "Imported Two", "country": "Kenya", "city": "Nairobi", "university_type": "private"},
+    ]
+    body = "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+
+    response = await api_client.post("/universities/import", content=body, params={"batch_size": 2})
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["received"], report["imported"], report["failed"]) == (4, 2, 2)
+    assert [error["row"] for error in report["errors"]] == [2, 4]
+
+    universities = await university_service.get_universities(db_session)
+    assert sorted(uni.name for uni in universities) == ["Imported One", "Imported Two"]
+    assert [p.name for uni in universities for p in uni.academic_programs] == ["Law"]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_can_be_imported_again(api_client, db_session, as_admin):
+    await seed_universities(db_session, 2)
+    export = await api_client.get("/universities/export", params={"format": "csv", "include_programs": True})
+
+    response = await api_client.post("/universities/import", content=export.content, params={"format": "csv"})
+    assert response.json()["imported"] == 2
+
+    universities = await university_service.get_universities(db_session)
+    assert len(universities) == 4
+    assert all(len(uni.academic_programs) == 1 for uni in universities)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_by_uid_groups_identical_changes(api_client, db_session, as_admin, engine_statements):
+    from app.models.university import Ranking
+
+    await seed_universities(db_session, 4)
+    universities = await university_service.get_universities(db_session)
+    missing = uuid.uuid4()
+
+    engine_statements.clear()
+    response = await api_client.patch("/universities/", json={"updates": [
+        {"uid": str(universities[0].uid), "fields": {"ranking": "A"}},
+        {"uid": str(universities[1].uid), "fields": {"ranking": "A"}},
+        {"uid": str(universities[2].uid), "fields": {"offers_scholarships": True}},
+        {"uid": str(missing), "fields": {"ranking": "A"}},
+    ]})
+    assert response.status_code == 200
+    result = response.json()
+    assert result["updated"] == 3
+    assert result["not_found"] == [str(missing)]
+    assert len([s for s in engine_statements if s.lstrip().upper().startswith("UPDATE")]) == 2
+
+    db_session.expire_all()
+    refreshed = {uni.uid: uni for uni in await university_service.get_universities(db_session)}
+    assert refreshed[universities[0].uid].ranking == Ranking.A
+    assert refreshed[universities[2].uid].offers_scholarships is True
+    assert refreshed[universities[3].uid].ranking == Ranking.NOT_RANKED
+    assert refreshed[universities[0].uid].updated_at > universities[0].created_at
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_by_filter(api_client, db_session, as_admin):
+    await seed_universities(db_session, 4)
+
+    response = await api_client.patch("/universities/", json={
+        "filter": {"country": "Kenya"},
+        "fields": {"average_annual_tuition": 1234.0},
+    })
+    assert response.json()["updated"] == 2
+
+    db_session.expire_all()
+    tuition = {uni.country: uni.average_annual_tuition for uni in await university_service.get_universities(db_session)}
+    assert tuition == {"Kenya": 1234.0, "Ghana": None}
+
+    empty_filter = await api_client.patch("/universities/", json={"filter": {}, "fields": {"ranking": "A"}})
+    assert empty_filter.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_delete_deactivates_programs_without_loading_them(api_client, db_session, as_admin, engine_statements):
+    universities = await seed_universities(db_session, 2)
+    target = universities[0].uid
+
+    engine_statements.clear()
+    response = await api_client.delete(f"/universities/{target}")
+    assert response.status_code == 204
+    assert [s.split()[0].upper() for s in engine_statements if not s.upper().startswith(("BEGIN", "COMMIT"))] == ["UPDATE", "UPDATE"]
+
+    remaining = await university_service.get_universities(db_session)
+    assert [uni.uid for uni in remaining] == [universities[1].uid]
+
+    missing = await api_client.delete(f"/universities/{uuid.uuid4()}")
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_deactivate_and_reactivate_by_filter(api_client, db_session, as_admin):
+    await seed_universities(db_session, 4)
+
+    response = await api_client.post("/universities/deactivate", json={"filter": {"country": "Kenya"}})
+    assert response.json()["updated"] == 2
+    listed = await api_client.get("/universities/")
+    assert {uni["country"] for uni in listed.json()} == {"Ghana"}
+
+    response = await api_client.post("/universities/reactivate", json={"filter": {"country": "Kenya"}})
+    assert response.json()["updated"] == 2
+    programs = await api_client.get(f"/universities/{response.json()['uids'][0]}/programs")
+    assert len(programs.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_facets_count_each_option_under_the_other_filters(api_client, db_session):
+    await seed_universities(db_session, 5)
+
+    response = await api_client.get("/universities/facets", params={"country": "Ghana", "limit": 2})
+    assert response.status_code == 200
+    body = response.json()
+
+    assert [uni["country"] for uni in body["results"]] == ["Ghana", "Ghana"]
+    facets = body["facets"]
+    assert facets["total"] == 3
+    # The country facet ignores the country filter, so the sidebar can offer Kenya
+    assert facets["country"] == [{"value": "Ghana", "count": 3}, {"value": "Kenya", "count": 2}]
+    assert facets["university_type"] == [{"value": "public", "count": 3}]
+    assert {facet["value"] for facet in facets["offers_scholarships"]} <= {"true", "false"}
+
+
+@pytest.mark.asyncio
+async def test_program_search_across_universities(api_client, db_session):
+    def program(name, degree_type, tuition_fee):
+        return AcademicProgramCreate(name=name, degree_type=degree_type, tuition_fee=tuition_fee, duration_years=2)
+
+    for name, country, languages, programs in [
+        ("Accra Tech", "Ghana", ["English"], [program("Computer Science", "Master's", 6000), program("Law", "Master's", 5000)]),
+        ("Dakar Uni", "Senegal", ["French"], [program("Computer Science", "Master's", 4000)]),
+        ("Nairobi Uni", "Kenya", ["English", "Swahili"], [
+            program("Computer Science", "Master's", 9000),
+            program("Computer Science", "Bachelor's", 3000),
+            program("Computer Engineering", "Master's", 7000),
+        ]),
+    ]:
+        await university_service.create_university(
+            UniversityCreate(name=name, country=country, city="City", university_type="public",
+                             languages_of_instruction=languages, academic_programs=programs),
+            db_session,
+        )
+
+    params = {"name": "Computer", "degree_type": "Master's", "max_tuition": 8000, "language": "English", "limit": 1}
+    first = await api_client.get("/universities/programs/search", params=params)
+    assert first.status_code == 200
+    assert [(p["name"], p["university_name"]) for p in first.json()] == [("Computer Engineering", "Nairobi Uni")]
+
+    second = await api_client.get(
+        "/universities/programs/search", params={**params, "cursor": first.headers["X-Next-Cursor"]}
+    )
+    assert [(p["name"], p["university_name"]) for p in second.json()] == [("Computer Science", "Accra Tech")]
+    assert "X-Next-Cursor" not in second.headers
+
+    # Cursors whose name or uid is not a string are rejected, not sent to the database
+    for values in ([42, str(uuid.uuid4())], ["Law", 5], ["Law", [1]]):
+        tampered = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+        response = await api_client.get("/universities/programs/search", params={"cursor": tampered})
+        assert response.status_code == 400, values
+
+
+@pytest.mark.asyncio
+async def test_range_filters_and_sorted_cursor_pages(api_client, db_session):
+    universities = []
+    for i, (tuition, ranking) in enumerate([(9000, "B"), (3000, "A+"), (None, "A"), (5000, "NOT_RANKED"), (7000, "B+")]):
+        universities.append(await university_service.create_university(
+            UniversityCreate(name=f"Uni {i}", country="Ghana", city="Accra", university_type="public",
+                             average_annual_tuition=tuition, ranking=ranking),
+            db_session,
+        ))
+
+    async def walk(limit=2, **params):
+        names, cursor = [], ""
+        while cursor is not None:
+            response = await api_client.get("/universities/", params={**params, "cursor": cursor, "limit": limit})
+            assert response.status_code == 200
+            names.extend(uni["name"] for uni in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+        return names
+
+    # Universities without tuition come last in both directions
+    assert await walk(sort="tuition") == ["Uni 1", "Uni 3", "Uni 4", "Uni 0", "Uni 2"]
+    assert await walk(sort="-tuition", limit=3) == ["Uni 0", "Uni 4", "Uni 3", "Uni 1", "Uni 2"]
+    assert await walk(sort="-tuition", max_tuition=7000) == ["Uni 4", "Uni 3", "Uni 1"]
+    assert await walk(sort="ranking") == ["Uni 1", "Uni 2", "Uni 4", "Uni 0", "Uni 3"]
+
+    offset = await api_client.get("/universities/", params={"sort": "-ranking", "limit": 2, "skip": 1})
+    assert [uni["name"] for uni in offset.json()] == ["Uni 0", "Uni 4"]
+    offset = await api_client.get("/universities/", params={"sort": "-tuition", "limit": 2, "skip": 3})
+    assert [uni["name"] for uni in offset.json()] == ["Uni 1", "Uni 2"]
+
+    # A cursor inside the universities without tuition pages on by uid
+    second_null = await university_service.create_university(
+        UniversityCreate(name="Uni 5", country="Ghana", city="Accra", university_type="public"), db_session
+    )
+    nulls = sorted([universities[2], second_null], key=lambda university: university.uid)
+    assert (await walk(sort="tuition", limit=1))[4:] == [university.name for university in nulls]
+
+    # Offset pages follow the same order, including pages that start among the universities without tuition
+    for sort in ("tuition", "-tuition"):
+        pages = [
+            [uni["name"] for uni in (await api_client.get(
+                "/universities/", params={"sort": sort, "limit": 2, "skip": skip}
+            )).json()]
+            for skip in range(0, 8, 2)
+        ]
+        assert sum(pages, []) == await walk(sort=sort)
+
+
+@pytest.mark.asyncio
+async def test_sorted_list_uses_its_index(db_engine, db_session):
+    from sqlalchemy import event
+
+    executions = []
+    listener = lambda conn, cursor, statement, parameters, *args: executions.append((statement, parameters))
+    event.listen(db_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        await university_service.get_universities_page(db_session, cursor="", limit=5, sort="tuition", country="Ghana")
+        # Offset mode past the universities with a value reads both parts
+        for sort in ("tuition", "-tuition"):
+            await university_service.get_university_summaries(db_session, skip=5, limit=5, sort=sort, country="Ghana")
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", listener)
+
+    async with db_engine.connect() as conn:
+        for statement, parameters in executions:
+            plan = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()
+            assert any("ix_universities_active_average_annual_tuition_uid" in row[-1] for row in plan)
+            assert not any("TEMP B-TREE" in row[-1] for row in plan), statement
+            # Postgres can only serve NULLS LAST from an ascending index, so each part
+            # orders in the index's own order, whichever the direction
+            assert "NULLS" not in statement
+
+
+@pytest.mark.asyncio
+async def test_total_count_modes(api_client, db_session):
+    await seed_universities(db_session, 5)
+
+    exact = await api_client.get("/universities/", params={"country": "Ghana", "limit": 1, "count": "exact"})
+    assert exact.headers["X-Total-Count"] == "3"
+
+    # Without Postgres statistics the estimate falls back to an exact count
+    estimated = await api_client.get("/universities/", params={"limit": 1, "count": "estimated"})
+    assert estimated.headers["X-Total-Count"] == "5"
+
+    assert await university_service.count_universities(db_session, mode="capped", cap=3) == "3+"
+    assert await university_service.count_universities(db_session, mode="capped", cap=5) == "5"
+
+    uncounted = await api_client.get("/universities/", params={"limit": 1})
+    assert "X-Total-Count" not in uncounted.headers
+
+
+@pytest.mark.asyncio
+async def test_create_and_update_return_programs(api_client, as_admin):
+    created = await api_client.post("/universities/", json={
+        "name": "New Uni", "country": "Ghana", "city": "Accra", "university_type": "public",
+        "academic_programs": [{"name": "Law", "degree_type": "Bachelor's"}],
+    })
+    assert created.status_code == 201
+    assert [p["name"] for p in created.json()["academic_programs"]] == ["Law"]
+
+    updated = await api_client.put(f"/universities/{created.json()['uid']}", json={"ranking": "A"})
+    assert updated.status_code == 200
+    assert updated.json()["ranking"] == "A"
+    assert [p["name"] for p in updated.json()["academic_programs"]] == ["Law"]
+
+
+@pytest.mark.asyncio
+async def test_list_statements_are_reused_with_new_values(db_session):
+    from app.services.university_service import list_statements
+
+    await seed_universities(db_session, 5)
+    list_statements.clear()
+
+    ghana = await university_service.get_university_summaries(db_session, country="Ghana", limit=10)
+    kenya = await university_service.get_university_summaries(db_session, country="Kenya", limit=1)
+    assert len(list_statements) == 1
+    assert {row.country for row in ghana} == {"Ghana"} and len(ghana) == 3
+    assert [row.name for row in kenya] == ["University 01"]
+
+    page, cursor = await university_service.get_universities_page(db_session, limit=2, city="Accra")
+    rest, _ = await university_service.get_universities_page(db_session, cursor=cursor, limit=2, city="Accra")
+    assert [row.name for row in page + rest] == ["University 00", "University 02", "University 04"]